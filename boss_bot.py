@@ -17,10 +17,26 @@ State machine:
 import time
 import re
 import random
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+import numpy as np
 import pyautogui
+from PIL import Image
+
+try:
+    import ahocorasick  # optional: single-pass multi-boss matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    # optional: fuzzy boss-name matching survives OCR errors
+    from rapidfuzz import fuzz, process as rf_process
+except ImportError:
+    fuzz = None
+    rf_process = None
 
 from shared import (
     find_game_window,
@@ -28,10 +44,15 @@ from shared import (
     load_boss_config,
     save_boss_config,
     click_at,
+    ocr_image,
+    ocr_image_lines,
     ocr_region,
+    ocr_region_lines,
     screenshot_region,
     check_brightness,
+    region_brightness_sparse,
     get_boss_positions,
+    warm_ocr_helper,
 )
 
 
@@ -51,6 +72,42 @@ MINI_BOSSES = [
 
 ALL_BOSSES = MVP_BOSSES + MINI_BOSSES
 
+MVP_SET = frozenset(MVP_BOSSES)
+
+
+def _make_automaton(names):
+    """Build an Aho-Corasick automaton over lowercase boss names.
+
+    Returns None when pyahocorasick isn't installed (callers fall back
+    to plain substring scans).
+    """
+    if ahocorasick is None or not names:
+        return None
+    auto = ahocorasick.Automaton()
+    for name in names:
+        auto.add_word(name.casefold(), name)
+    auto.make_automaton()
+    return auto
+
+# Precompiled patterns used on every OCR pass
+_CH_RE = re.compile(r'ch\s*(\d+)', re.IGNORECASE)
+_TIMER_RE = re.compile(r'(\d{1,2}:\d{2}:\d{2})')
+
+# Characters that can appear in (lowercased) monster names, including the
+# Turkish client's glyphs. Stripping everything else from OCR output keeps
+# stray punctuation from spoiling substring matches.
+_NON_NAME_RE = re.compile(r"[^a-z0-9 '\-üğşıöçi̇]")
+
+
+def _clean_name_text(text):
+    """Strip OCR garbage characters that can't occur in monster names."""
+    return _NON_NAME_RE.sub("", text.lower()).strip()
+
+
+# Dropdown entries that must never be clicked (one DFA pass instead of
+# N substring scans per row)
+_SKIP_RE = re.compile(r"all\s+monsters?|tüm\s+canavarlar", re.IGNORECASE)
+
 
 # ═══════════════════════════════════════
 #  State Machine
@@ -76,14 +133,21 @@ class BossFarmingBot:
     Communicates status via log_callback and exposes state for the TUI.
     """
 
-    def __init__(self, log_callback=None):
+    def __init__(self, log_callback=None, state_callback=None):
         self.log = log_callback or (lambda msg: None)
-        self.state = BossState.IDLE
+        # Fired whenever displayed state changes so the TUI can update
+        # on events instead of polling
+        self._on_state_change = state_callback or (lambda: None)
+        self._state = BossState.IDLE
         self.running = False
         self._thread = None
+        self._win_thread = None
+        self._stop_event = threading.Event()
 
-        # Current target
+        # Current target (matching strings precomputed by _set_target)
         self.target_boss = None
+        self._target_lower = ""
+        self._target_words = ()
         self.target_is_mvp = True
 
         # Stats
@@ -94,24 +158,76 @@ class BossFarmingBot:
         # Config
         self.selected_mvps = []
         self.selected_minis = []
+        # Immutable (name, casefolded) pairs so the OCR scan doesn't
+        # re-casefold every boss name on every row
+        self._mvp_targets_lc = ()
+        self._mini_targets_lc = ()
+        self._mvp_automaton = None
+        self._mini_automaton = None
         self.check_interval = 30  # seconds between panel checks when idle
 
         # Positions (loaded on start)
         self._win = None
+        self._win_lock = threading.Lock()
+        self._win_key = None  # (x, y, w, h) the positions were computed for
         self._layout = None
         self._boss_pos = None
+        self._row_go_y = None  # per-row Go button Y, derived from _boss_pos
+        self._drag_point_cache = {}  # row_idx -> card drag point
 
-        # Timers: boss_name -> last_seen_timer_text
+        # Timers: boss_name -> last_seen_timer_text. The version counter
+        # invalidates the TUI status cache on every timer update.
         self.boss_timers = {}
+        self._timer_version = 0
+
+        # Formatted per-boss status strings for the TUI, rebuilt lazily
+        # when state/target/timers change
+        self._status_cache = {}
+        self._status_cache_key = None
+
+        # Loading-screen check throttle: the check screenshots a chunk of
+        # the window, and loading screens last many seconds anyway.
+        self._last_loading_check = 0.0
+        self._loading_visible = False
+
+        # Latest minimap brightness, published by the capture worker
+        self._minimap_brightness = None
+
+        # Death-check counter: the screen-brightness fallback only runs
+        # on every Nth check (the OCR check is decisive when positive)
+        self._death_brightness_tick = 0
+
+        # Dropdown entry height learned from observed OCR line spacing
+        # (the hardcoded 38px is only a guess about the UI)
+        self._entry_height = None
+
+        # Worker pool for capture/OCR calls that can run while the state
+        # machine sits in a click cooldown or tick sleep
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
 
     # ─── Public API ───
 
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        self._state = value
+        self._on_state_change()
+
     def start(self):
         if self.running:
             return
         config = load_boss_config()
         self.selected_mvps = config.get("selected_mvps", [])
         self.selected_minis = config.get("selected_minis", [])
+        self._mvp_targets_lc = tuple((b, b.casefold())
+                                     for b in self.selected_mvps)
+        self._mini_targets_lc = tuple((b, b.casefold())
+                                      for b in self.selected_minis)
+        self._mvp_automaton = _make_automaton(self.selected_mvps)
+        self._mini_automaton = _make_automaton(self.selected_minis)
 
         if not self.selected_mvps and not self.selected_minis:
             self.log("No bosses selected! Select bosses in the panel first.")
@@ -127,24 +243,45 @@ class BossFarmingBot:
             self.log("Game window not found!")
             return
 
+        self._win_key = (self._win["x"], self._win["y"],
+                         self._win["w"], self._win["h"])
         self._boss_pos = get_boss_positions(self._win, self._layout)
+        self._refresh_derived_positions()
+
+        warm_ocr_helper()
 
         self.running = True
+        self._stop_event.clear()
         self.state = BossState.IDLE
         self._thread = threading.Thread(target=self._main_loop, daemon=True)
         self._thread.start()
+        self._win_thread = threading.Thread(target=self._window_poller,
+                                            daemon=True)
+        self._win_thread.start()
         self.log("Boss bot started")
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
         self.state = BossState.IDLE
-        self.target_boss = None
+        self._set_target(None)
         self.log("Boss bot stopped")
 
+    def _set_target(self, boss):
+        """Set the current target boss and precompute its match strings."""
+        self.target_boss = boss
+        self._target_lower = boss.lower() if boss else ""
+        self._target_words = tuple(self._target_lower.split())
+        self._on_state_change()
+
     def update_selection(self, mvps, minis):
         """Update boss selection (called from TUI)."""
         self.selected_mvps = mvps
         self.selected_minis = minis
+        self._mvp_targets_lc = tuple((b, b.casefold()) for b in mvps)
+        self._mini_targets_lc = tuple((b, b.casefold()) for b in minis)
+        self._mvp_automaton = _make_automaton(mvps)
+        self._mini_automaton = _make_automaton(minis)
         save_boss_config({
             "selected_mvps": mvps,
             "selected_minis": minis,
@@ -153,14 +290,35 @@ class BossFarmingBot:
 
     # ─── Main Loop ───
 
+    def _window_poller(self):
+        """Refresh the game window rect at 0.5 Hz.
+
+        Enumerating windows via CoreGraphics is too expensive for the
+        main loop, and the window rarely moves — poll it slowly here.
+        """
+        while self.running:
+            new_win = find_game_window()
+            if new_win:
+                with self._win_lock:
+                    self._win = new_win
+            if self._stop_event.wait(2.0):
+                return
+
     def _main_loop(self):
         while self.running:
             try:
-                # Refresh window position
-                new_win = find_game_window()
+                # Read the window rect from the poller thread; position
+                # math is deterministic in the rect, so only recompute
+                # when it actually moved.
+                with self._win_lock:
+                    new_win = self._win
                 if new_win:
-                    self._win = new_win
-                    self._boss_pos = get_boss_positions(self._win, self._layout)
+                    key = (new_win["x"], new_win["y"],
+                           new_win["w"], new_win["h"])
+                    if key != self._win_key:
+                        self._win_key = key
+                        self._boss_pos = get_boss_positions(self._win, self._layout)
+                        self._refresh_derived_positions()
 
                 if not self._boss_pos:
                     self.log("Boss positions unavailable")
@@ -201,17 +359,56 @@ class BossFarmingBot:
                 self.log(f"Error in state {self.state.value}: {e}")
                 time.sleep(3)
 
+    def _refresh_derived_positions(self):
+        """Precompute per-row Go-button Y coordinates from _boss_pos.
+
+        The Go button was calibrated on one row; every other row's Y is a
+        fixed row-height offset from it, so build the lookup table once
+        per window move instead of redoing the arithmetic on every click.
+        """
+        self._row_go_y = None
+        self._drag_point_cache.clear()
+        pos = self._boss_pos
+        if not pos or "go_button" not in pos or "first_boss_row" not in pos:
+            return
+        go_y = pos["go_button"][1]
+        row_h = pos.get("row_height", 101)
+        first_y = pos["first_boss_row"][1]
+        calib_row = round((go_y - first_y) / row_h) if row_h > 0 else 0
+        self._row_go_y = [go_y + (i - calib_row) * row_h for i in range(8)]
+
+    def _wait_until(self, pred, timeout, interval=0.15):
+        """Poll pred until it's true or timeout expires.
+
+        Returns the final truth value. Used after clicks so the bot
+        moves on as soon as the UI reacts instead of always sleeping
+        the worst-case delay.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if pred():
+                return True
+            if self._stop_event.wait(interval):
+                return False
+        return pred()
+
+    def _jsleep(self, base, jitter=0.5):
+        """Sleep for base plus a uniform jitter.
+
+        Single call site for all randomized waits; backed by the stop
+        Event so stop() preempts any in-flight delay immediately.
+        """
+        self._stop_event.wait(base + random.random() * jitter)
+
     # ─── State Handlers ───
 
     def _handle_idle(self):
         """Wait and periodically check the boss panel for spawns."""
         self.log("Waiting for boss spawn...")
 
-        # Check every N seconds
-        for _ in range(self.check_interval):
-            if not self.running:
-                return
-            time.sleep(1)
+        # Sleep the whole interval at once; wakes immediately on stop()
+        if self._stop_event.wait(self.check_interval):
+            return
 
         # Time to check - switch to CH1 first if needed
         self.state = BossState.SWITCH_CH1
@@ -219,93 +416,34 @@ class BossFarmingBot:
     def _handle_switch_ch1(self):
         """Switch to Channel 1 where bosses spawn.
 
-        First OCRs the channel button to check current channel.
-        If already on CH 1, skips opening the modal entirely.
+        Thin wrapper over _ensure_ch1 — sharing one code path (and its
+        OCR cache) with the post-loading-screen check.
         """
-        pos = self._boss_pos
-
-        # OCR a wider area around the channel button to read "CH 1" etc.
-        # Note: the arrow icon next to the number gets misread as "1" by OCR,
-        # e.g. "CH 2" → "CH 21", "CH 10" → "CH 101".
-        # The real number is all digits with the trailing arrow-"1" stripped.
-        ch_x, ch_y = pos["channel_button"]
-        ch_text = ocr_region(ch_x - 60, ch_y - 15, 130, 35)
-        self.log(f"Current channel OCR: '{ch_text.strip()}'")
-
-        ch_match = re.search(r'ch\s*(\d+)', ch_text, re.IGNORECASE)
-        if ch_match:
-            raw_digits = ch_match.group(1)
-            # Strip trailing "1" from arrow misread (only if >1 digit)
-            if len(raw_digits) > 1 and raw_digits.endswith("1"):
-                channel_num = raw_digits[:-1]
-            else:
-                channel_num = raw_digits
-        else:
-            channel_num = None
-
-        self.log(f"Detected channel: {channel_num}")
-
-        if channel_num == "1":
-            self.current_channel = "CH 1"
-            self.log("Already on CH 1, skipping channel switch.")
-            self.state = BossState.OPEN_PANEL
-            return
-
-        # Click channel button and verify the modal opened.
-        # Retry up to 3 times — sometimes the click doesn't register.
-        ch1_x, ch1_y = pos["ch1_button"]
-        modal_opened = False
-
-        for attempt in range(3):
-            self.log(f"Opening channel selector (attempt {attempt + 1})...")
-            click_at(*pos["channel_button"], jitter=0)
-            time.sleep(2.0 + random.random() * 0.5)
-
-            # Check if the channel modal opened — the modal is a bright popup
-            # in the center area around where CH 1 button is
-            modal_opened = check_brightness(
-                ch1_x - 60, ch1_y - 40, 120, 80, threshold=150
-            )
-            if modal_opened:
-                break
-            self.log("Channel modal didn't open, retrying...")
-            time.sleep(1.0 + random.random() * 0.5)
-
-        if not modal_opened:
-            self.log("Failed to open channel modal. Proceeding to panel anyway.")
-            self.state = BossState.OPEN_PANEL
-            return
-
-        # Click CH 1 in the popup
-        self.log("Selecting CH 1...")
-        click_at(*pos["ch1_button"], jitter=2)
-        time.sleep(2.0 + random.random() * 1.0)
-
-        self.current_channel = "CH 1"
-        self.log("Switched to CH 1")
+        self._ensure_ch1()
         self.state = BossState.OPEN_PANEL
 
     def _handle_open_panel(self):
         """Open the MVP/Mini panel and scroll to top to normalize."""
         pos = self._boss_pos
 
-        # Click the MVP panel button on top bar, verify it opened
+        # Click the MVP panel button on top bar, verify it opened.
+        # The panel header around the close (X) button is bright when open.
         MAX_RETRIES = 3
+        close_x, close_y = pos["panel_close"]
         panel_open = False
         for attempt in range(MAX_RETRIES):
             click_at(*pos["mvp_panel_button"], jitter=3)
-            time.sleep(1.2 + random.random() * 0.5)
-
-            # Check if the panel opened by looking for brightness around the
-            # panel close (X) button — the panel header is bright when open
-            close_x, close_y = pos["panel_close"]
-            panel_open = check_brightness(
-                close_x - 40, close_y - 15, 80, 30, threshold=160
+            panel_open = self._wait_until(
+                lambda: check_brightness(
+                    close_x - 40, close_y - 15, 80, 30, threshold=160),
+                timeout=1.7,
             )
             if panel_open:
+                # Small settle so the list finishes animating in
+                self._jsleep(0.1, 0.1)
                 break
             self.log(f"Panel didn't open (attempt {attempt + 1}/{MAX_RETRIES}), retrying...")
-            time.sleep(0.5 + random.random() * 0.3)
+            self._jsleep(0.5, 0.3)
 
         if not panel_open:
             self.log("Failed to open MVP panel after retries. Back to IDLE.")
@@ -324,7 +462,7 @@ class BossFarmingBot:
             self.state = BossState.IDLE
             return
 
-        time.sleep(0.8 + random.random() * 0.3)
+        self._jsleep(0.8, 0.3)
 
         # Scroll to top to normalize position before reading
         self._scroll_to_top()
@@ -349,34 +487,54 @@ class BossFarmingBot:
         row_h = pos.get("row_height", sh // 4)
 
         if self._checking_mvp_tab:
-            targets = self.selected_mvps
+            targets = self._mvp_targets_lc
+            automaton = self._mvp_automaton
         else:
-            targets = self.selected_minis
+            targets = self._mini_targets_lc
+            automaton = self._mini_automaton
 
         # Scan 2 pages (page 1 = rows 1-4, page 2 = rows 5-8)
         found_boss = None
         found_on_page = 0
+        seen = set()  # selected bosses spotted so far
 
         for page in range(2):
-            # OCR each of the 4 visible rows individually
-            for row_idx in range(4):
-                row_y = sy + row_idx * row_h
-                row_text = ocr_region(sx, row_y, sw, row_h)
-                row_lower = row_text.lower()
-
-                # Check if THIS row has a target boss AND "appeared"/"battle"
-                for boss in targets:
-                    if boss.lower() in row_lower:
-                        if ("appeared" in row_lower
-                                or "inthebattle" in row_lower
-                                or "battle" in row_lower):
-                            found_boss = boss
-                            self._found_row_idx = row_idx
-                            break
-                        # Record timer for this boss
-                        timer_match = re.search(r"(\d{1,2}:\d{2}:\d{2})", row_text)
-                        if timer_match:
-                            self.boss_timers[boss] = timer_match.group(1)
+            # One OCR pass over the whole visible list. Vision returns each
+            # text line with its vertical position, which maps back to a row —
+            # much cheaper than four separate OCR invocations per page.
+            rows = ["", "", "", ""]
+            for y_frac, line in ocr_region_lines(sx, sy, sw, sh):
+                row_idx = int(y_frac * sh) // row_h if row_h > 0 else 0
+                if 0 <= row_idx < 4:
+                    rows[row_idx] += (" " if rows[row_idx] else "") + line
+
+            for row_idx, row_text in enumerate(rows):
+                row_lower = row_text.casefold()
+
+                # Which of the selected bosses appear in this row?
+                if automaton is not None:
+                    # Single multi-pattern pass over the row text
+                    present = list(dict.fromkeys(
+                        name for _, name in automaton.iter(row_lower)))
+                else:
+                    present = [boss for boss, boss_lc in targets
+                               if boss_lc in row_lower]
+                seen.update(present)
+
+                # A row counts as a spawn when it has "appeared"/"battle"
+                for boss in present:
+                    if ("appeared" in row_lower
+                            or "inthebattle" in row_lower
+                            or "battle" in row_lower):
+                        found_boss = boss
+                        self._found_row_idx = row_idx
+                        break
+                    # Record timer for this boss
+                    timer_match = _TIMER_RE.search(row_text)
+                    if timer_match:
+                        self.boss_timers[boss] = timer_match.group(1)
+                        self._timer_version += 1
+                        self._on_state_change()
 
                 if found_boss:
                     break
@@ -385,14 +543,19 @@ class BossFarmingBot:
                 found_on_page = page
                 break
 
-            # Scroll down for page 2 (only after page 1)
+            # Scroll down for page 2 (only after page 1, and only when a
+            # selected boss might still be below the fold — if every
+            # target was already visible, the scroll + second OCR pass
+            # buys nothing)
             if page == 0:
+                if len(seen) >= len(targets):
+                    break
                 self._scroll_panel_down(sx + sw // 2, sy + sh // 2, scroll_dist)
-                time.sleep(0.6 + random.random() * 0.3)
+                self._jsleep(0.6, 0.3)
 
         if found_boss:
-            self.target_boss = found_boss
-            self.target_is_mvp = found_boss in MVP_BOSSES
+            self._set_target(found_boss)
+            self.target_is_mvp = found_boss in MVP_SET
             self.log(f"{found_boss} appeared! (row {self._found_row_idx + 1}, page {found_on_page + 1})")
             self.state = BossState.CLICK_GO
             return
@@ -405,7 +568,7 @@ class BossFarmingBot:
         if self._checking_mvp_tab and self.selected_minis:
             click_at(*pos["mini_tab"], jitter=3)
             self._checking_mvp_tab = False
-            time.sleep(0.8 + random.random() * 0.3)
+            self._jsleep(0.8, 0.3)
             self._scroll_to_top()
             return  # re-enters CHECK_STATUS for mini tab
 
@@ -418,19 +581,16 @@ class BossFarmingBot:
         """Click the Go button on the correct row for the found boss."""
         pos = self._boss_pos
 
-        # The Go button is calibrated for one row. Adjust Y by the row offset.
-        go_x, go_y = pos["go_button"]
-        row_h = pos.get("row_height", 101)
-        first_y = pos["first_boss_row"][1]
-        # Calibrated go_button might be on any row — calculate which row it was on
-        calib_row = round((go_y - first_y) / row_h) if row_h > 0 else 0
-        # Offset to the found row
-        row_offset = (getattr(self, '_found_row_idx', 0) - calib_row) * row_h
-        target_go_y = go_y + row_offset
+        # The Go button is calibrated for one row; the precomputed table
+        # maps the found row straight to its Y coordinate.
+        go_x = pos["go_button"][0]
+        if self._row_go_y is None:
+            self._refresh_derived_positions()
+        target_go_y = self._row_go_y[getattr(self, '_found_row_idx', 0)]
 
         self.log(f"Clicking Go for {self.target_boss} (row {getattr(self, '_found_row_idx', 0) + 1})...")
         click_at(go_x, target_go_y, jitter=2)
-        time.sleep(2.0 + random.random() * 0.5)
+        self._jsleep(2.0, 0.5)
 
         # Verify the panel actually closed (Go closes it automatically).
         # Sometimes scroll jumps and Go isn't clicked — panel stays open.
@@ -441,7 +601,7 @@ class BossFarmingBot:
         if panel_still_open:
             self.log("Panel still open after Go click — closing manually...")
             self._close_panel()
-            time.sleep(1.0 + random.random() * 0.3)
+            self._jsleep(1.0, 0.3)
 
         # Wait for loading screen (map change) to appear and finish
         self.log("Waiting for loading screen...")
@@ -494,24 +654,11 @@ class BossFarmingBot:
         minimap_btn_y = ch_y + 50
         self.log("Opening minimap to track movement...")
 
-        # Check if minimap is already open; if not, click to open
+        # The minimap content area (compared frame-to-frame below)
         minimap_check_x = ch_x - 120
         minimap_check_y = ch_y + 40
         minimap_check_w = 150
         minimap_check_h = 150
-        is_open = check_brightness(
-            minimap_check_x, minimap_check_y,
-            minimap_check_w, minimap_check_h, threshold=140
-        )
-        if not is_open:
-            click_at(minimap_btn_x, minimap_btn_y, jitter=1)
-            time.sleep(1.0 + random.random() * 0.3)
-
-        # Region to compare: the minimap content area
-        snap_x = minimap_check_x
-        snap_y = minimap_check_y
-        snap_w = minimap_check_w
-        snap_h = minimap_check_h
 
         STABLE_DURATION = 5.0   # seconds of no change = arrived
         MAX_WAIT = 120.0
@@ -519,16 +666,43 @@ class BossFarmingBot:
         # Pixel difference threshold: below this % means "same image"
         DIFF_THRESHOLD = 2.0
 
-        last_snapshot = None
+        # Capture + diff runs in a helper thread so this loop only consumes
+        # the most recent diff value and stays responsive to stop(). The
+        # worker also publishes each frame's brightness, which doubles as
+        # the open/closed check without extra screenshots.
+        self._minimap_brightness = None
+        done = threading.Event()
+        diff_queue = queue.Queue(maxsize=1)
+        worker = threading.Thread(
+            target=self._minimap_capture_worker,
+            args=((minimap_check_x, minimap_check_y,
+                   minimap_check_w, minimap_check_h), diff_queue, done,
+                  POLL_INTERVAL),
+            daemon=True,
+        )
+        worker.start()
+
+        # First frame's brightness tells us whether the minimap is open
+        deadline = time.time() + 2.0
+        while self._minimap_brightness is None and time.time() < deadline:
+            time.sleep(0.1)
+        brightness = self._minimap_brightness
+        if brightness is None or brightness <= 140:
+            click_at(minimap_btn_x, minimap_btn_y, jitter=1)
+            self._jsleep(1.0, 0.3)
+
         stable_since = None
         start_time = time.time()
         self.log(f"Walking to {self.target_boss}... watching minimap")
 
-        while self.running and (time.time() - start_time) < MAX_WAIT:
-            current_snapshot = screenshot_region(snap_x, snap_y, snap_w, snap_h)
-
-            if last_snapshot is not None:
-                diff_pct = self._image_diff_percent(last_snapshot, current_snapshot)
+        try:
+            while self.running and (time.time() - start_time) < MAX_WAIT:
+                if self._stop_event.is_set():
+                    break
+                try:
+                    diff_pct = diff_queue.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
 
                 if diff_pct > DIFF_THRESHOLD:
                     # Image changed — still moving
@@ -544,44 +718,71 @@ class BossFarmingBot:
                         self.log(f"Arrived at {self.target_boss}! (minimap stable for {STABLE_DURATION}s)")
                         break
             else:
-                stable_since = time.time()
+                if self.running:
+                    self.log("Navigation timeout (120s). Proceeding anyway...")
 
-            last_snapshot = current_snapshot
-            time.sleep(POLL_INTERVAL)
-        else:
-            if self.running:
-                self.log("Navigation timeout (120s). Proceeding anyway...")
-
-        # Close the minimap
-        self.log("Closing minimap...")
-        click_at(minimap_btn_x, minimap_btn_y, jitter=1)
-        time.sleep(0.8 + random.random() * 0.3)
-
-        # Verify minimap closed
-        still_open = check_brightness(
-            minimap_check_x, minimap_check_y,
-            minimap_check_w, minimap_check_h, threshold=140
-        )
-        if still_open:
-            click_at(minimap_btn_x, minimap_btn_y, jitter=0)
-            time.sleep(0.5)
+            # Close the minimap; the worker keeps sampling, so its next
+            # brightness reading verifies the close without a fresh grab.
+            self.log("Closing minimap...")
+            click_at(minimap_btn_x, minimap_btn_y, jitter=1)
+            if not self._stop_event.wait(POLL_INTERVAL + 0.3):
+                still = self._minimap_brightness
+                if still is not None and still > 140:
+                    click_at(minimap_btn_x, minimap_btn_y, jitter=0)
+                    time.sleep(0.5)
+        finally:
+            done.set()
+            worker.join(timeout=2.0)
+
+    def _minimap_capture_worker(self, region, diff_queue, done, poll_interval):
+        """Producer side of _wait_for_arrival.
+
+        Captures minimap frames and publishes the diff against the previous
+        frame into a one-slot queue (newest value wins). Also publishes
+        each frame's mean brightness on self._minimap_brightness so the
+        open/close checks can reuse the latest frame.
+        """
+        x, y, w, h = region
+        last_gray = None
+        while not (done.is_set() or self._stop_event.is_set()):
+            try:
+                gray = self._gray_small(screenshot_region(x, y, w, h))
+            except Exception:
+                break
+            self._minimap_brightness = float(gray.mean())
+            if last_gray is not None:
+                diff = self._array_diff_percent(last_gray, gray)
+                try:
+                    diff_queue.get_nowait()  # drop the stale value
+                except queue.Empty:
+                    pass
+                try:
+                    diff_queue.put_nowait(diff)
+                except queue.Full:
+                    pass
+            last_gray = gray
+            if done.wait(poll_interval):
+                break
 
     @staticmethod
-    def _image_diff_percent(img1, img2):
-        """Calculate the percentage of pixels that differ between two PIL images.
+    def _gray_small(img):
+        """Downsampled grayscale array of a snapshot, ready for diffing.
 
-        Converts to grayscale, computes per-pixel absolute difference,
-        and returns the percentage of pixels that differ by more than 10 levels.
+        int16 avoids uint8 wraparound on the later subtraction.
         """
-        g1 = img1.convert("L")
-        g2 = img2.convert("L")
-        pixels1 = list(g1.getdata())
-        pixels2 = list(g2.getdata())
-        if len(pixels1) != len(pixels2):
+        return np.asarray(img.convert("L").resize((32, 32), Image.BILINEAR),
+                          dtype=np.int16)
+
+    @staticmethod
+    def _array_diff_percent(a, b):
+        """Percentage of entries differing by more than 10 levels."""
+        if a.shape != b.shape:
             return 100.0
-        total = len(pixels1)
-        changed = sum(1 for a, b in zip(pixels1, pixels2) if abs(a - b) > 10)
-        return (changed / total) * 100.0
+        diff = np.abs(a - b)
+        if diff.max() <= 10:
+            return 0.0
+        changed = np.count_nonzero(diff > 10)
+        return float(changed) * 100.0 / a.size
 
     def _handle_start_attack(self):
         """Close minimap if open, then toggle auto-attack and select boss monster."""
@@ -593,7 +794,7 @@ class BossFarmingBot:
         # Click auto-attack toggle to open the monster dropdown
         self.log("Enabling auto-attack...")
         click_at(*pos["auto_attack_toggle"], jitter=3)
-        time.sleep(1.0 + random.random() * 0.5)
+        self._jsleep(1.0, 0.5)
 
         # OCR the monster dropdown to find the boss name
         self._select_boss_from_monster_list()
@@ -610,9 +811,14 @@ class BossFarmingBot:
         """
         FIGHTING_TIMEOUT = 90  # seconds
 
-        # Check for death
-        if self._detect_death():
+        # Kick off the death check in the worker pool so its OCR runs
+        # during the between-tick sleep instead of adding to it.
+        death_future = self._io_pool.submit(self._detect_death)
+        self._jsleep(2.0, 1.0)
+
+        if death_future.result():
             self.deaths += 1
+            self._on_state_change()
             self.log(f"Died! (death #{self.deaths})")
             self.state = BossState.DEAD
             return
@@ -621,16 +827,14 @@ class BossFarmingBot:
         elapsed = time.time() - getattr(self, '_fighting_start', time.time())
         if elapsed > FIGHTING_TIMEOUT:
             self.log(f"Fighting timeout ({FIGHTING_TIMEOUT}s). Boss may be dead. Re-checking panel...")
-            self.target_boss = None
+            self._set_target(None)
             self.state = BossState.IDLE
             return
 
-        time.sleep(2.0 + random.random() * 1.0)
-
     def _handle_dead(self):
         """Player died - prepare to resurrect."""
         # Brief pause before resurrect (game has a short delay)
-        time.sleep(2.0 + random.random() * 1.0)
+        self._jsleep(2.0, 1.0)
         self.state = BossState.RESURRECT
 
     def _handle_resurrect(self):
@@ -639,14 +843,14 @@ class BossFarmingBot:
 
         self.log("Clicking resurrect...")
         click_at(*pos["resurrect_button"], jitter=4)
-        time.sleep(3.0 + random.random() * 1.0)
+        self._jsleep(3.0, 1.0)
 
         # Verify we're alive (check for resurrect button gone)
         if self._detect_death():
             # Still dead, try again
             self.log("Resurrect failed, retrying...")
             click_at(*pos["resurrect_button"], jitter=4)
-            time.sleep(3.0 + random.random() * 1.0)
+            self._jsleep(3.0, 1.0)
 
         self.log("Resurrected! Re-navigating to boss...")
         self.state = BossState.RE_NAVIGATE
@@ -662,20 +866,31 @@ class BossFarmingBot:
 
     # ─── Channel Helpers ───
 
+    def _ocr_region_cached(self, x, y, w, h):
+        """OCR a region, memoized on the raw pixel content.
+
+        Thin wrapper over the shared content-keyed OCR cache.
+        """
+        return ocr_region(x, y, w, h, cache=True)
+
     def _ensure_ch1(self):
         """Check current channel and switch to CH 1 if needed.
 
-        Inline version of _handle_switch_ch1 for use within other methods
-        (e.g. after loading screens during navigation).
+        Used both by the SWITCH_CH1 state and inline after loading
+        screens during navigation. If already on CH 1, skips opening
+        the modal entirely.
         """
         pos = self._boss_pos
 
-        # OCR the channel button
+        # OCR a wider area around the channel button to read "CH 1" etc.
+        # Note: the arrow icon next to the number gets misread as "1" by OCR,
+        # e.g. "CH 2" → "CH 21", "CH 10" → "CH 101".
+        # The real number is all digits with the trailing arrow-"1" stripped.
         ch_x, ch_y = pos["channel_button"]
-        ch_text = ocr_region(ch_x - 60, ch_y - 15, 130, 35)
+        ch_text = self._ocr_region_cached(ch_x - 60, ch_y - 15, 130, 35)
         self.log(f"Post-load channel OCR: '{ch_text.strip()}'")
 
-        ch_match = re.search(r'ch\s*(\d+)', ch_text, re.IGNORECASE)
+        ch_match = _CH_RE.search(ch_text)
         if ch_match:
             raw_digits = ch_match.group(1)
             if len(raw_digits) > 1 and raw_digits.endswith("1"):
@@ -687,6 +902,7 @@ class BossFarmingBot:
 
         if channel_num == "1":
             self.current_channel = "CH 1"
+            self._on_state_change()
             self.log("Already on CH 1.")
             return
 
@@ -697,7 +913,7 @@ class BossFarmingBot:
         modal_opened = False
         for attempt in range(3):
             click_at(*pos["channel_button"], jitter=0)
-            time.sleep(2.0 + random.random() * 0.5)
+            self._jsleep(2.0, 0.5)
 
             modal_opened = check_brightness(
                 ch1_x - 60, ch1_y - 40, 120, 80, threshold=150
@@ -705,12 +921,12 @@ class BossFarmingBot:
             if modal_opened:
                 break
             self.log(f"Channel modal didn't open (attempt {attempt + 1}), retrying...")
-            time.sleep(1.0 + random.random() * 0.5)
+            self._jsleep(1.0, 0.5)
 
         if modal_opened:
             self.log("Selecting CH 1...")
             click_at(*pos["ch1_button"], jitter=2)
-            time.sleep(2.0 + random.random() * 1.0)
+            self._jsleep(2.0, 1.0)
 
             # Wait for possible loading screen from channel switch
             time.sleep(2.0)
@@ -718,6 +934,7 @@ class BossFarmingBot:
                 self._wait_for_loading_screen()
 
             self.current_channel = "CH 1"
+            self._on_state_change()
             self.log("Switched to CH 1.")
         else:
             self.log("Failed to open channel modal. Continuing anyway.")
@@ -728,17 +945,26 @@ class BossFarmingBot:
         """Detect if a loading screen is showing.
 
         Loading screens are very dark and cover the entire game window.
-        Check the center of the screen for low brightness.
+        Check the center of the screen for low brightness. Rechecks at
+        most once per second; in between, the last observation is reused.
         """
         if not self._win:
             return False
+
+        now = time.monotonic()
+        if now - self._last_loading_check < 1.0:
+            return self._loading_visible
+        self._last_loading_check = now
+
         wx, wy = self._win["x"], self._win["y"]
         ww, wh = self._win["w"], self._win["h"]
-        # Sample a large center area
+        # A 64x64 center patch is enough — loading screens are uniformly
+        # dark, so there's no need to screenshot a quarter of the window.
         is_dark = not check_brightness(
-            wx + ww // 4, wy + wh // 4, ww // 2, wh // 2,
+            wx + ww // 2 - 32, wy + wh // 2 - 32, 64, 64,
             threshold=40  # Loading screens are very dark
         )
+        self._loading_visible = is_dark
         return is_dark
 
     def _wait_for_loading_screen(self):
@@ -750,10 +976,11 @@ class BossFarmingBot:
         MAX_WAIT = 30.0
         start = time.time()
         while self.running and (time.time() - start) < MAX_WAIT:
-            time.sleep(1.0)
+            if self._stop_event.wait(1.0):
+                return
             if not self._detect_loading_screen():
                 # Screen is back — wait a bit more for UI to settle
-                time.sleep(2.0 + random.random() * 1.0)
+                self._jsleep(2.0, 1.0)
                 self.log("Loading complete. Re-checking channel...")
                 return
         self.log("Loading screen timeout (30s). Proceeding...")
@@ -767,12 +994,21 @@ class BossFarmingBot:
         pos = self._boss_pos
         rx, ry = pos["resurrect_button"]
 
-        # Check area around resurrect button for "Resurrect" text
-        text = ocr_region(rx - 60, ry - 15, 120, 30)
+        # Check area around resurrect button for "Resurrect" text. The
+        # region is polled every few seconds while fighting; the
+        # region_id shortcut skips OCR whenever those pixels are
+        # unchanged from the last poll.
+        text = ocr_region(rx - 60, ry - 15, 120, 30, region_id="resurrect")
         if "resurrect" in text.lower() or "revive" in text.lower():
             return True
 
-        # Also check screen brightness (death screen is darker)
+        # Also check screen brightness (death screen is darker). This
+        # screenshots a quarter of the window, so only sample every 5th
+        # check — the cheap OCR check above already catches real deaths.
+        self._death_brightness_tick += 1
+        if self._death_brightness_tick % 5 != 0:
+            return False
+
         if self._win:
             wx, wy = self._win["x"], self._win["y"]
             ww, wh = self._win["w"], self._win["h"]
@@ -800,10 +1036,21 @@ class BossFarmingBot:
         pos = self._boss_pos
         if "panel_close" in pos:
             click_at(*pos["panel_close"], jitter=3)
-            time.sleep(0.5 + random.random() * 0.3)
+            self._jsleep(0.5, 0.3)
 
     def _get_card_drag_point(self, row_idx=1):
-        """Get the center of a boss card for drag scrolling.
+        """Get the center of a boss card for drag scrolling (memoized).
+
+        The card grid is static between window moves, so the computed
+        point is cached per row (invalidated with the derived positions).
+        """
+        if row_idx not in self._drag_point_cache:
+            self._drag_point_cache[row_idx] = \
+                self._compute_card_drag_point(row_idx)
+        return self._drag_point_cache[row_idx]
+
+    def _compute_card_drag_point(self, row_idx):
+        """Compute the center of a boss card for drag scrolling.
 
         The boss list is on the LEFT side of the panel.
         Must start the drag ON a card, not between cards.
@@ -839,19 +1086,17 @@ class BossFarmingBot:
         time.sleep(0.2)
 
     def _scroll_to_top(self):
-        """Scroll boss list to top: drag down on a card twice."""
+        """Scroll boss list to top with one long downward drag."""
         pos = self._boss_pos
-        row_h = pos.get("row_height", 101)
         scroll_dist = pos.get("scroll_distance", 405)
 
         # Start drag on the 2nd card (row 1) — safe middle position
         cx, cy = self._get_card_drag_point(row_idx=1)
 
-        # Drag down generously twice to guarantee top
-        self._drag_scroll(cx, cy, scroll_dist)
-        time.sleep(0.2)
-        self._drag_scroll(cx, cy, scroll_dist)
-        time.sleep(0.3)
+        # One generous drag (list is only 2 pages deep) instead of two
+        # back-to-back drags with settle sleeps between them
+        self._drag_scroll(cx, cy, int(scroll_dist * 1.8))
+        time.sleep(0.25)
 
     def _scroll_panel_down(self, cx_unused, cy_unused, distance):
         """Scroll list down: drag UP on a card to reveal lower bosses."""
@@ -875,46 +1120,47 @@ class BossFarmingBot:
         pos = self._boss_pos
         ch_x, ch_y = pos["channel_button"]
 
-        # The minimap region sits below the channel button, top-right of screen.
-        # Check a ~150x150 area below the channel button for brightness.
-        minimap_check_x = ch_x - 120
-        minimap_check_y = ch_y + 40
-        minimap_check_w = 150
-        minimap_check_h = 150
+        # The minimap region sits below the channel button, top-right of
+        # screen. Both the detect and the verify sample this same
+        # ~150x150 rectangle.
+        minimap_region = (ch_x - 120, ch_y + 40, 150, 150)
 
-        is_bright = check_brightness(
-            minimap_check_x, minimap_check_y,
-            minimap_check_w, minimap_check_h,
-            threshold=140  # minimap has bright map content
-        )
+        THRESHOLD = 140  # minimap has bright map content
+        # The map fills the region uniformly, so 9 probe points are as
+        # good as averaging all 22,500 pixels
+        first_val = region_brightness_sparse(*minimap_region)
 
-        if is_bright:
+        if first_val > THRESHOLD:
             self.log("Minimap detected (bright), closing it...")
             # Click the minimap toggle button to close it
             minimap_btn_x = ch_x
             minimap_btn_y = ch_y + 50
             click_at(minimap_btn_x, minimap_btn_y, jitter=1)
-            time.sleep(0.8 + random.random() * 0.3)
 
-            # Verify it closed
-            still_bright = check_brightness(
-                minimap_check_x, minimap_check_y,
-                minimap_check_w, minimap_check_h,
-                threshold=140
-            )
-            if still_bright:
-                self.log("Minimap still open, trying again...")
-                click_at(minimap_btn_x, minimap_btn_y, jitter=0)
-                time.sleep(0.8 + random.random() * 0.3)
+            # When the reading was unmistakably "open", trust the click;
+            # only borderline readings get the poll-and-retry treatment.
+            if first_val > THRESHOLD + 25:
+                self._jsleep(0.3, 0.2)
+            else:
+                closed = self._wait_until(
+                    lambda: region_brightness_sparse(*minimap_region)
+                    <= THRESHOLD,
+                    timeout=1.1,
+                )
+                self._jsleep(0.05, 0.1)
+                if not closed:
+                    self.log("Minimap still open, trying again...")
+                    click_at(minimap_btn_x, minimap_btn_y, jitter=0)
+                    self._jsleep(0.8, 0.3)
         else:
             self.log("Minimap not detected, proceeding to auto-attack.")
 
     def _select_boss_from_monster_list(self):
         """OCR the monster dropdown list and click on the boss name.
 
-        The auto-attack dropdown shows nearby monsters. We scan each row
-        via OCR to find the target boss, then click on that specific entry.
-        Falls back to the first entry if the boss name isn't found.
+        The auto-attack dropdown shows nearby monsters. One OCR pass over
+        the whole dropdown returns each line with its vertical position,
+        which maps back to an entry index — no per-row re-OCR needed.
         """
         pos = self._boss_pos
         first_x, first_y = pos["monster_list_first"]
@@ -931,51 +1177,129 @@ class BossFarmingBot:
         region_w = ENTRY_WIDTH
         region_h = ENTRY_HEIGHT * MAX_ENTRIES
 
-        full_text = ocr_region(region_x, region_y, region_w, region_h)
+        # Grab the dropdown bitmap once; the line OCR and any row-crop
+        # fallback below all work from this in-memory image.
+        full_img = screenshot_region(region_x, region_y, region_w, region_h)
+        lines = ocr_image_lines(full_img, enhance=True)
+        full_text = " ".join(text for _, text in lines)
         self.log(f"Monster list OCR: {full_text[:80]}")
 
-        # Per-row OCR to find the exact row with the boss name
-        boss_lower = self.target_boss.lower() if self.target_boss else ""
-        # Also try partial matches (e.g. "Dragon Fly" might show as "Dragon fly")
-        boss_words = boss_lower.split()
+        # Match strings were precomputed when the target was set; partial
+        # matches cover casing drift (e.g. "Dragon Fly" vs "Dragon fly")
+        boss_lower = self._target_lower
+        boss_words = self._target_words
+
+        # If the boss is nowhere in the dropdown text at all, don't
+        # bother matching rows — nothing to click.
+        full_lower = full_text.lower()
+        if boss_lower:
+            if fuzz is not None:
+                present = fuzz.partial_ratio(boss_lower, full_lower) >= 80
+            else:
+                present = (boss_lower in full_lower
+                           or (boss_words
+                               and all(w in full_lower for w in boss_words)))
+            if not present:
+                self.log(f"[yellow]Boss '{self.target_boss}' not found in monster list. Not attacking.[/]")
+                self._jsleep(0.5, 0.3)
+                return
 
-        # Blacklist: never click these entries
-        SKIP_ENTRIES = {"all monsters", "all monster", "tüm canavarlar"}
+        # Learn the real entry height from the spacing of recognized
+        # lines — the hardcoded value is a guess, and a misaligned grid
+        # splits names across two buckets.
+        if self._entry_height is None and len(lines) >= 3:
+            tops = sorted(int(y_frac * region_h) for y_frac, _ in lines)
+            gaps = sorted(b - a for a, b in zip(tops, tops[1:]) if b - a > 10)
+            if gaps:
+                learned = gaps[len(gaps) // 2]
+                if 25 <= learned <= 60:
+                    self._entry_height = learned
+                    self.log(f"Learned dropdown entry height: {learned}px")
+        entry_h = self._entry_height or ENTRY_HEIGHT
+
+        # Bucket lines into entries by their vertical position.
+        # Entry i starts 5px into the region (region_y = first_y - 10,
+        # row crops used to start at first_y + i*ENTRY_HEIGHT - 5).
+        rows = ["" for _ in range(MAX_ENTRIES)]
+        for y_frac, text in lines:
+            row_idx = (int(y_frac * region_h) - 5) // entry_h
+            if 0 <= row_idx < MAX_ENTRIES:
+                rows[row_idx] += (" " if rows[row_idx] else "") + text
 
         found_row = None
-        for row_idx in range(MAX_ENTRIES):
-            row_y = first_y + row_idx * ENTRY_HEIGHT - 5
-            row_text = ocr_region(region_x, row_y, ENTRY_WIDTH, ENTRY_HEIGHT)
-            row_lower = row_text.lower().strip()
-
-            if not row_lower:
-                continue
-
-            # Never select "All Monsters"
-            if any(skip in row_lower for skip in SKIP_ENTRIES):
-                self.log(f"Skipping '{row_text.strip()}' (row {row_idx + 1})")
-                continue
-
-            # Exact match
-            if boss_lower in row_lower:
-                found_row = row_idx
-                self.log(f"Found {self.target_boss} at monster list row {row_idx + 1}")
-                break
+        if fuzz is not None and boss_lower:
+            # Fuzzy scoring picks the best row even when OCR mangles the
+            # name ("Dragon Fiy", "Dragcn Fly"). Skip entries never score.
+            candidates = {
+                row_idx: _clean_name_text(row_text)
+                for row_idx, row_text in enumerate(rows)
+                if row_text.strip() and not _SKIP_RE.search(row_text)
+            }
+            if candidates:
+                best = rf_process.extractOne(
+                    boss_lower, candidates,
+                    scorer=fuzz.partial_ratio, score_cutoff=80,
+                )
+                if best:
+                    found_row = best[2]
+                    self.log(f"Found {self.target_boss} at monster list row {found_row + 1} (score {best[1]:.0f})")
+        else:
+            for row_idx, row_text in enumerate(rows):
+                row_lower = _clean_name_text(row_text)
 
-            # Partial match: all words of boss name appear in row
-            if boss_words and all(w in row_lower for w in boss_words):
-                found_row = row_idx
-                self.log(f"Found {self.target_boss} (partial) at row {row_idx + 1}: '{row_text.strip()}'")
-                break
+                if not row_lower:
+                    continue
+
+                # Never select "All Monsters"
+                if _SKIP_RE.search(row_lower):
+                    self.log(f"Skipping '{row_text.strip()}' (row {row_idx + 1})")
+                    continue
+
+                # Exact match
+                if boss_lower in row_lower:
+                    found_row = row_idx
+                    self.log(f"Found {self.target_boss} at monster list row {row_idx + 1}")
+                    break
+
+                # Partial match: all words of boss name appear in row
+                if boss_words and all(w in row_lower for w in boss_words):
+                    found_row = row_idx
+                    self.log(f"Found {self.target_boss} (partial) at row {row_idx + 1}: '{row_text.strip()}'")
+                    break
+
+        if found_row is None:
+            # Line bucketing can fumble a row boundary; fall back to
+            # cropping the in-memory bitmap (no new screen grabs) and
+            # OCRing each entry individually. The captured bitmap is at
+            # backing scale (2x on Retina), so crop boxes must be scaled
+            # from logical region coordinates.
+            scale_y = full_img.height / region_h
+            for row_idx in range(MAX_ENTRIES):
+                top = 5 + row_idx * entry_h
+                bottom = min(top + entry_h, region_h)
+                crop = full_img.crop(
+                    (0, int(top * scale_y),
+                     full_img.width, int(bottom * scale_y)))
+                row_lower = _clean_name_text(ocr_image(crop, fast=True))
+                if not row_lower:
+                    continue
+                if _SKIP_RE.search(row_lower):
+                    continue
+                if boss_lower in row_lower or (
+                        boss_words
+                        and all(w in row_lower for w in boss_words)):
+                    found_row = row_idx
+                    self.log(f"Found {self.target_boss} via row crops at row {row_idx + 1}")
+                    break
 
         if found_row is not None:
-            click_y = first_y + found_row * ENTRY_HEIGHT + ENTRY_HEIGHT // 2
+            click_y = first_y + found_row * entry_h + entry_h // 2
             click_at(first_x, click_y, jitter=3)
         else:
             # Boss not found — do NOT click anything, especially not "All Monsters"
             self.log(f"[yellow]Boss '{self.target_boss}' not found in monster list. Not attacking.[/]")
 
-        time.sleep(0.5 + random.random() * 0.3)
+        self._jsleep(0.5, 0.3)
 
     # ─── Status for TUI ───
 
@@ -993,8 +1317,27 @@ class BossFarmingBot:
         """Get last known timer for a boss."""
         return self.boss_timers.get(boss_name, "--:--:--")
 
+    @property
+    def display_version(self):
+        """Changes whenever per-boss display statuses may have changed."""
+        return (self.state, self.target_boss, self._timer_version)
+
     def get_boss_status(self, boss_name):
-        """Get display status for a boss in the TUI."""
+        """Get display status for a boss in the TUI.
+
+        The TUI asks for every boss row on every refresh; the formatted
+        strings are cached and only rebuilt when the state, target, or
+        a timer actually changed.
+        """
+        key = self.display_version
+        if key != self._status_cache_key:
+            self._status_cache_key = key
+            self._status_cache = {b: self._format_boss_status(b)
+                                  for b in ALL_BOSSES}
+        return self._status_cache.get(boss_name, "⏱ --:--:--")
+
+    def _format_boss_status(self, boss_name):
+        """Build the display status for one boss."""
         if boss_name == self.target_boss:
             if self.state == BossState.FIGHTING:
                 return "Fighting!"
@@ -17,27 +17,73 @@ Safety:
     Press Ctrl+C to stop gracefully.
 """
 
+import numpy as np
 import pyautogui
-from PIL import Image, ImageEnhance
+from PIL import Image
+import functools
+import hashlib
+import io
 import time
 import re
-import tempfile
+import operator
 import sys
 import os
 import random
 
 from shared import (
     find_game_window,
+    screenshot_region,
     get_window_or_exit,
     load_layout,
     save_layout,
     click_at,
     type_on_numpad,
-    ocr_vision,
+    ocr_vision_batch_data,
+    ocr_vision_data,
     SCRIPT_DIR,
     CONFIG_FILE,
 )
 
+try:
+    # optional: translation-robust template matching for the garden check
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Pixel kernels, fastest available first: the prebuilt Cython extension
+# (see setup.py), then Numba JIT, then plain NumPy.
+try:
+    from garden_ext import patch_diff as _patch_diff, mean_u8 as _mean_u8
+except ImportError:
+    try:
+        # optional: LLVM-compiled pixel kernels (fused SIMD reductions
+        # with no intermediate arrays)
+        from numba import njit
+
+        @njit(cache=True, fastmath=True)
+        def _patch_diff(a, b):
+            """Sum of absolute differences over two flat pixel buffers."""
+            s = 0
+            for i in range(a.size):
+                s += abs(int(a[i]) - int(b[i]))
+            return s
+
+        @njit(cache=True, fastmath=True)
+        def _mean_u8(a):
+            """Mean of a flat uint8 buffer."""
+            s = 0
+            for i in range(a.size):
+                s += a[i]
+            return s / a.size
+
+    except ImportError:
+        def _patch_diff(a, b):
+            return int(np.abs(a.astype(np.int32) - b.astype(np.int32)).sum())
+
+        def _mean_u8(a):
+            return float(a.mean())
+
+
 # --- Config ---
 
 GARDEN_REF_FILE = os.path.join(SCRIPT_DIR, "garden_ref.png")
@@ -45,6 +91,8 @@ GARDEN_REF_FILE = os.path.join(SCRIPT_DIR, "garden_ref.png")
 # Garden button detection
 GARDEN_PATCH_SIZE = 40    # pixels around garden button to compare
 GARDEN_MATCH_THRESHOLD = 0.85  # similarity threshold (0-1)
+GARDEN_SEARCH_PAD = 10    # extra ROI pixels for template matching
+GARDEN_NCC_THRESHOLD = 0.8  # normalized cross-correlation cutoff
 
 # Math expression region: auto-detected from calibrated input_field position
 MATH_ABOVE_INPUT = 25   # pixels above input field
@@ -54,6 +102,10 @@ MATH_HEIGHT = 36        # height of OCR capture region
 # OK button is always below the input field, same X
 OK_BELOW_INPUT = 85     # pixels below input field
 
+# Change-gate threshold: sum of absolute differences between 8x8 grayscale
+# thumbs of the math region above which the frame counts as "changed"
+CAPTCHA_THUMB_DIFF = 40
+
 
 # ═══════════════════════════════════════
 #  Calibration
@@ -94,6 +146,10 @@ def calibrate():
     ref_region = (p.x - half, p.y - half, GARDEN_PATCH_SIZE, GARDEN_PATCH_SIZE)
     ref_shot = pyautogui.screenshot(region=ref_region)
     ref_shot.save(GARDEN_REF_FILE)
+    # Also store raw RGB bytes so the bot can load the reference
+    # without a PNG decode
+    with open(GARDEN_REF_FILE + ".raw", "wb") as f:
+        f.write(ref_shot.convert("RGB").tobytes())
     print(f"         Reference saved: {GARDEN_REF_FILE}")
     print()
 
@@ -160,27 +216,22 @@ def _show_calculated(win, layout):
     print(f"    Grid spacing : col={cs:.0f}px row={rs:.0f}px")
 
 
-def get_positions(win, layout):
-    """Calculate all absolute screen positions from window + calibrated offsets."""
-    wx, wy = win["x"], win["y"]
+# Window-relative offsets are a pure function of the layout, so they are
+# computed once per layout and only the window origin is added per call.
+# The cache holds the layout itself and hits on identity — an id() key
+# could collide with a recycled address after a recalibration.
+_OFFSETS_CACHE = {"layout": None, "offsets": None}
+
+
+def _layout_offsets(layout):
+    """Derive all window-relative offsets from the calibrated layout."""
     gb = layout["garden_button"]
     inp = layout["input_field"]
     n1 = layout["numpad_1"]
     n0 = layout["numpad_0"]
 
-    garden_pos = (wx + gb[0], wy + gb[1])
-
-    math_x = wx + inp[0] - MATH_WIDTH // 2
-    math_y = wy + inp[1] - MATH_ABOVE_INPUT - MATH_HEIGHT
-    math_region = (math_x, math_y, MATH_WIDTH, MATH_HEIGHT)
-
-    input_pos = (wx + inp[0], wy + inp[1])
-    ok_pos = (wx + inp[0], wy + inp[1] + OK_BELOW_INPUT)
-
-    x1 = wx + n1[0]
-    y1 = wy + n1[1]
-    x0 = wx + n0[0]
-    y0 = wy + n0[1]
+    x1, y1 = n1
+    x0, y0 = n0
     cs = (x0 - x1) / 3.0
     rs = (y0 - y1) / 1.0
 
@@ -200,43 +251,120 @@ def get_positions(win, layout):
     }
 
     return {
-        "garden": garden_pos,
-        "math_region": math_region,
-        "input": input_pos,
-        "ok": ok_pos,
+        "garden": tuple(gb),
+        "math": (inp[0] - MATH_WIDTH // 2,
+                 inp[1] - MATH_ABOVE_INPUT - MATH_HEIGHT),
+        "input": tuple(inp),
+        "ok": (inp[0], inp[1] + OK_BELOW_INPUT),
         "numpad": numpad,
     }
 
 
+def get_positions(win, layout):
+    """Calculate all absolute screen positions from window + calibrated offsets."""
+    if _OFFSETS_CACHE["layout"] is not layout:
+        _OFFSETS_CACHE["offsets"] = _layout_offsets(layout)
+        _OFFSETS_CACHE["layout"] = layout
+    off = _OFFSETS_CACHE["offsets"]
+
+    wx, wy = win["x"], win["y"]
+    mx, my = off["math"]
+
+    return {
+        "garden": (wx + off["garden"][0], wy + off["garden"][1]),
+        "math_region": (wx + mx, wy + my, MATH_WIDTH, MATH_HEIGHT),
+        "input": (wx + off["input"][0], wy + off["input"][1]),
+        "ok": (wx + off["ok"][0], wy + off["ok"][1]),
+        "numpad": {key: (wx + ox, wy + oy)
+                   for key, (ox, oy) in off["numpad"].items()},
+    }
+
+
 # ═══════════════════════════════════════
 #  CAPTCHA Detection & OCR
 # ═══════════════════════════════════════
 
+# Decoded reference patch, keyed on the PNG's mtime so a recalibration
+# is picked up without re-decoding the file every cycle
+_REF_CACHE = {"mtime": None, "arr": None}
+
+
+def _load_garden_ref():
+    """Return the reference patch as a uint8 array, cached by file mtime."""
+    mtime = os.path.getmtime(GARDEN_REF_FILE)
+    if _REF_CACHE["mtime"] != mtime:
+        arr = None
+        # Prefer the raw RGB dump written at calibration — wrapping it
+        # with frombuffer skips the PNG decode and RGB conversion
+        raw_path = GARDEN_REF_FILE + ".raw"
+        size = GARDEN_PATCH_SIZE
+        try:
+            if os.path.getmtime(raw_path) >= mtime:
+                with open(raw_path, "rb") as f:
+                    data = f.read()
+                if len(data) == size * size * 3:
+                    arr = np.frombuffer(data, dtype=np.uint8)
+                    arr = arr.reshape(size, size, 3)
+        except OSError:
+            pass
+        if arr is None:
+            ref = Image.open(GARDEN_REF_FILE)
+            arr = np.asarray(ref.convert("RGB"), dtype=np.uint8)
+        _REF_CACHE["arr"] = arr
+        _REF_CACHE["mtime"] = mtime
+    return _REF_CACHE["arr"]
+
+
 def is_garden_visible(positions):
     """Check if the garden button is visible by comparing to the calibration reference."""
     if not os.path.exists(GARDEN_REF_FILE):
         return True
 
-    ref = Image.open(GARDEN_REF_FILE)
+    ref_arr = _load_garden_ref()
     gx, gy = positions["garden"]
     half = GARDEN_PATCH_SIZE // 2
-    current = pyautogui.screenshot(region=(int(gx - half), int(gy - half),
-                                           GARDEN_PATCH_SIZE, GARDEN_PATCH_SIZE))
 
-    ref_pixels = list(ref.convert("RGB").getdata())
-    cur_pixels = list(current.convert("RGB").getdata())
-
-    if len(ref_pixels) != len(cur_pixels):
+    if cv2 is not None:
+        # Normalized cross-correlation over a slightly padded ROI —
+        # tolerant of the small UI shifts that break a strict pixel diff
+        pad = GARDEN_SEARCH_PAD
+        roi = screenshot_region(gx - half - pad, gy - half - pad,
+                                GARDEN_PATCH_SIZE + 2 * pad,
+                                GARDEN_PATCH_SIZE + 2 * pad)
+        roi_arr = np.asarray(roi.convert("RGB"), dtype=np.uint8)
+        result = cv2.matchTemplate(roi_arr, np.ascontiguousarray(ref_arr),
+                                   cv2.TM_CCOEFF_NORMED)
+        return float(cv2.minMaxLoc(result)[1]) >= GARDEN_NCC_THRESHOLD
+
+    current = screenshot_region(gx - half, gy - half,
+                                GARDEN_PATCH_SIZE, GARDEN_PATCH_SIZE)
+
+    # The kernels widen before subtracting, so uint8 buffers are safe
+    cur_arr = np.asarray(current.convert("RGB"), dtype=np.uint8)
+
+    if ref_arr.shape != cur_arr.shape:
         return True
 
-    total = len(ref_pixels) * 3
-    diff_sum = sum(
-        abs(r1 - r2) + abs(g1 - g2) + abs(b1 - b2)
-        for (r1, g1, b1), (r2, g2, b2) in zip(ref_pixels, cur_pixels)
-    )
-    similarity = 1.0 - (diff_sum / (total * 255))
+    # The decision is just a threshold, so stop summing once the error
+    # budget is blown: walk the buffer in 8 tiles and bail early when
+    # the images are clearly different.
+    max_allowed = (1.0 - GARDEN_MATCH_THRESHOLD) * ref_arr.size * 255
+    ref_flat = ref_arr.ravel()
+    cur_flat = cur_arr.ravel()
+    tile = max(1, ref_flat.size // 8)
+    diff_sum = 0
+    for start in range(0, ref_flat.size, tile):
+        diff_sum += int(_patch_diff(ref_flat[start:start + tile],
+                                    cur_flat[start:start + tile]))
+        if diff_sum > max_allowed:
+            return False
+    return True
 
-    return similarity >= GARDEN_MATCH_THRESHOLD
+
+def _dialog_brightness(shot):
+    """Mean brightness of a math-region capture (dialogs are bright)."""
+    arr = np.asarray(shot.convert("L"), dtype=np.uint8)
+    return float(_mean_u8(arr.ravel()))
 
 
 def is_dialog_visible(positions):
@@ -245,31 +373,38 @@ def is_dialog_visible(positions):
     if w <= 0 or h <= 0:
         return False
 
-    shot = pyautogui.screenshot(region=(x, y, w, h))
-    gray = shot.convert("L")
-    avg_brightness = sum(gray.getdata()) / len(list(gray.getdata()))
-
-    return avg_brightness > 160
+    shot = screenshot_region(x, y, w, h)
+    return _dialog_brightness(shot) > 160
 
 
 def _capture_math_region(positions):
     """Screenshot the math expression region."""
     x, y, w, h = positions["math_region"]
-    return pyautogui.screenshot(region=(x, y, w, h)), w, h
+    return screenshot_region(x, y, w, h), w, h
+
+
+# Precompiled patterns for the OCR normalization hot path
+_RE_T_PLUS = re.compile(r"(\d)[tT](\d)")
+_RE_IL_MINUS = re.compile(r"(\d)[lI|](\d)")
+_RE_KEEP = re.compile(r"[^0-9+\-*/]")
+_RE_EXPR = re.compile(r"^(\d+)([+\-*/])(\d+)$")
+_RE_EXPR_SEARCH = re.compile(r"(\d+)([+\-*/])(\d+)")
+_RE_HAS_DIGIT = re.compile(r"\d")
+_RE_DIGITS_ONLY = re.compile(r"[^0-9]")
+
+# Single-pass character fixups (drops spaces, maps OCR'd multiply/divide
+# glyphs) instead of five chained str.replace scans
+_TRANSTAB = str.maketrans({" ": "", "×": "*", "x": "*", "X": "*", "÷": "/"})
 
 
 def _normalize_expression(raw):
     """Normalize OCR output into a clean math expression."""
-    expr = raw.replace(" ", "")
-
-    for ch in ["×", "x", "X"]:
-        expr = expr.replace(ch, "*")
-    expr = expr.replace("÷", "/")
+    expr = raw.translate(_TRANSTAB)
 
-    expr = re.sub(r"(\d)[tT](\d)", r"\1+\2", expr)
-    expr = re.sub(r"(\d)[lI|](\d)", r"\1-\2", expr)
+    expr = _RE_T_PLUS.sub(r"\1+\2", expr)
+    expr = _RE_IL_MINUS.sub(r"\1-\2", expr)
 
-    expr = re.sub(r"[^0-9+\-*/]", "", expr)
+    expr = _RE_KEEP.sub("", expr)
     return expr
 
 
@@ -277,105 +412,174 @@ def _extract_expression(raw):
     """Extract a valid 'digit(s) operator digit(s)' pattern from noisy OCR."""
     normalized = _normalize_expression(raw)
 
-    m = re.match(r"^(\d+)([+\-*/])(\d+)$", normalized)
-    if m:
+    if _RE_EXPR.match(normalized):
         return normalized
 
-    m = re.search(r"(\d+)([+\-*/])(\d+)", normalized)
+    m = _RE_EXPR_SEARCH.search(normalized)
     if m:
         return m.group(0)
 
     return None
 
 
-# All valid single-digit expression results for brute-force recovery
-_VALID_EXPRESSIONS = {}
-for _a in range(1, 10):
-    for _b in range(1, 10):
-        for _op in ["+", "-", "*"]:
-            _result = eval(f"{_a}{_op}{_b}")
-            _key = f"{_a}{_b}"
-            if _key not in _VALID_EXPRESSIONS:
-                _VALID_EXPRESSIONS[_key] = []
-            _VALID_EXPRESSIONS[_key].append((f"{_a}{_op}{_b}", _result))
+# Integer ops for evaluating validated "a OP b" expressions — no eval()
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+}
+
+# All valid single-digit expression results for brute-force recovery.
+# Built lazily — commands like `window` or `calibrate` never need it.
+_VALID_EXPRESSIONS = None
+
+
+def _get_valid_expressions():
+    global _VALID_EXPRESSIONS
+    if _VALID_EXPRESSIONS is None:
+        table = {}
+        for a in range(1, 10):
+            for b in range(1, 10):
+                for op in ["+", "-", "*"]:
+                    table.setdefault(f"{a}{b}", []).append(
+                        (f"{a}{op}{b}", _OPS[op](a, b)))
+        # Pre-sort by recovery preference (non-negative results first,
+        # then + over * over -) so lookups just take the first viable hit
+        order = {"+": 0, "*": 1, "-": 2}
+        for matches in table.values():
+            matches.sort(key=lambda m: (m[1] < 0, order[m[0][1]]))
+        _VALID_EXPRESSIONS = table
+    return _VALID_EXPRESSIONS
 
 
 def _brute_force_from_digits(all_candidates):
     """Last resort: try to find the expression by matching against known single-digit math."""
     digit_candidates = []
     for source, raw in all_candidates:
-        cleaned = re.sub(r"[^0-9]", "", raw)
+        cleaned = _RE_DIGITS_ONLY.sub("", raw)
         if len(cleaned) == 2:
             digit_candidates.append(cleaned)
 
     if not digit_candidates:
         return None
 
-    from collections import Counter
-    most_common = Counter(digit_candidates).most_common(1)[0][0]
+    # A handful of 2-char strings — a plain dict tally beats importing
+    # and constructing a Counter for this
+    counts = {}
+    for digits in digit_candidates:
+        counts[digits] = counts.get(digits, 0) + 1
+    most_common = max(counts, key=counts.get)
 
-    matches = _VALID_EXPRESSIONS.get(most_common, [])
+    matches = _get_valid_expressions().get(most_common, [])
     if len(matches) == 1:
-        expr, result = matches[0]
-        return expr
+        return matches[0][0]
 
-    for preferred_op in ["+", "*", "-"]:
-        for expr, result in matches:
-            if preferred_op in expr and result >= 0:
-                return expr
+    # The table is pre-sorted by recovery preference
+    for expr, result in matches:
+        if result >= 0:
+            return expr
 
     return None
 
 
-def _ocr_single_shot(shot, w, h):
-    """Run Vision OCR on a screenshot with multiple preprocessing strategies."""
-    candidates = []
+def _png_bytes(img):
+    """Encode a PIL image as PNG bytes (fast, low-compression)."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        shot.save(f.name)
-        text = ocr_vision(f.name)
-        os.unlink(f.name)
-    if text:
-        candidates.append(("raw", text))
+def _ocr_variants(shot, w, h):
+    """Yield (source, text) OCR candidates lazily, cheapest first.
 
-    big = shot.resize((w * 4, h * 4), Image.LANCZOS)
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        big.save(f.name)
-        text = ocr_vision(f.name)
-        os.unlink(f.name)
-    if text:
-        candidates.append(("scaled", text))
+    The raw shot usually reads fine, so the preprocessing variants are
+    only built and OCR'd if the caller keeps iterating.
+    """
+    yield "raw", ocr_vision_data(_png_bytes(shot))
+
+    # Raw failed — build both preprocessing variants and send them to
+    # the helper in a single batched round-trip rather than two.
+    if cv2 is not None:
+        # SIMD cubic upscale plus an Otsu binarization, which handles
+        # odd dialog backgrounds better than a fixed contrast boost
+        arr = np.asarray(shot.convert("RGB"), dtype=np.uint8)
+        big_arr = cv2.resize(arr, None, fx=4, fy=4,
+                             interpolation=cv2.INTER_CUBIC)
+        big = Image.fromarray(big_arr)
+        gray = cv2.cvtColor(big_arr, cv2.COLOR_RGB2GRAY)
+        _, bw = cv2.threshold(gray, 0, 255,
+                              cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        enhanced = Image.fromarray(bw)
+    else:
+        # Bilinear is plenty for Vision at 4x upscale and much cheaper
+        # than Lanczos; the contrast boost is one clipped NumPy pass
+        # instead of PIL's enhancer walking the image again.
+        big = shot.resize((w * 4, h * 4), Image.BILINEAR)
+        gray_arr = np.asarray(big.convert("L"), dtype=np.int16)
+        enhanced = Image.fromarray(
+            np.clip((gray_arr - 128) * 3 + 128, 0, 255).astype(np.uint8))
 
-    gray = big.convert("L")
-    enhanced = ImageEnhance.Contrast(gray).enhance(3.0)
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        enhanced.save(f.name)
-        text = ocr_vision(f.name)
-        os.unlink(f.name)
-    if text:
-        candidates.append(("contrast", text))
+    texts = ocr_vision_batch_data([_png_bytes(big), _png_bytes(enhanced)])
+    yield "scaled", texts[0]
+    yield "contrast", texts[1]
 
-    return candidates
 
+def read_math_expression(positions, debug=False, shot=None):
+    """OCR the math expression using macOS Vision framework.
 
-def read_math_expression(positions, debug=False):
-    """OCR the math expression using macOS Vision framework."""
-    shot, w, h = _capture_math_region(positions)
+    Pass a pre-captured math-region shot to avoid a second screenshot
+    when the caller already grabbed one for dialog detection.
+    """
+    if shot is None:
+        shot, w, h = _capture_math_region(positions)
+    else:
+        w, h = shot.size
 
     if debug:
         shot.save(os.path.join(SCRIPT_DIR, "debug_math_raw.png"))
 
-    all_candidates = _ocr_single_shot(shot, w, h)
+    # Try variants lazily: in the common case the raw shot already
+    # yields a clean expression and the other two are never OCR'd.
+    all_candidates = []
+    for source, raw in _ocr_variants(shot, w, h):
+        if not raw:
+            continue
+        all_candidates.append((source, raw))
+        expr = _extract_expression(raw)
+        if expr:
+            if debug:
+                print(f"    Winner: '{raw}' -> '{expr}' (from {source})")
+            return expr
 
-    has_digits = any(re.search(r"\d", text) for _, text in all_candidates)
+    has_digits = any(_RE_HAS_DIGIT.search(text)
+                     for _, text in all_candidates)
 
     if not has_digits:
         x, y, rw, rh = positions["math_region"]
+        # One taller capture covers every vertical shift; each retry is
+        # then an in-memory crop instead of a fresh screen grab. The
+        # capture is at backing scale (2x on Retina), so crop boxes are
+        # scaled from logical coordinates.
+        PAD_UP, PAD_DOWN = 20, 15
+        band = screenshot_region(x, y - PAD_UP, rw, rh + PAD_UP + PAD_DOWN)
+        scale = band.height / (rh + PAD_UP + PAD_DOWN)
         for dy in [-12, -20, 8, 15]:
-            shifted_region = (x, y + dy, rw, rh)
-            shifted_shot = pyautogui.screenshot(region=shifted_region)
-            shifted_candidates = _ocr_single_shot(shifted_shot, rw, rh)
-            if any(re.search(r"\d", text) for _, text in shifted_candidates):
+            shifted_shot = band.crop(
+                (0, int((PAD_UP + dy) * scale),
+                 band.width, int((PAD_UP + dy + rh) * scale)))
+            shifted_candidates = []
+            for source, raw in _ocr_variants(shifted_shot, rw, rh):
+                if not raw:
+                    continue
+                shifted_candidates.append((source, raw))
+                expr = _extract_expression(raw)
+                if expr:
+                    if debug:
+                        print(f"\n    Winner at dy={dy}: '{raw}' -> '{expr}' (from {source})")
+                    return expr
+            if any(_RE_HAS_DIGIT.search(text)
+                   for _, text in shifted_candidates):
                 all_candidates = shifted_candidates
                 if debug:
                     print(f"\n    Region shifted by dy={dy} to find digits")
@@ -384,13 +588,6 @@ def read_math_expression(positions, debug=False):
     if debug:
         print(f"\n    OCR candidates: {all_candidates}")
 
-    for source, raw in all_candidates:
-        expr = _extract_expression(raw)
-        if expr:
-            if debug:
-                print(f"    Winner: '{raw}' -> '{expr}' (from {source})")
-            return expr
-
     brute = _brute_force_from_digits(all_candidates)
     if brute:
         if debug:
@@ -408,12 +605,13 @@ def solve_expression(raw):
     if not expr:
         return None
 
-    if not re.match(r"^\d+[+\-*/]\d+$", expr):
+    m = _RE_EXPR.match(expr)
+    if not m:
         return None
 
     try:
-        return int(eval(expr))
-    except Exception:
+        return int(_OPS[m.group(2)](int(m.group(1)), int(m.group(3))))
+    except ZeroDivisionError:
         return None
 
 
@@ -421,29 +619,70 @@ def solve_expression(raw):
 #  CAPTCHA Handler
 # ═══════════════════════════════════════
 
-def handle_captcha(positions, debug=False):
-    """Detect, read, solve, and submit the CAPTCHA."""
-    if not is_dialog_visible(positions):
+@functools.lru_cache(maxsize=1024)
+def _solve_cached(raw):
+    """solve_expression memoized on the raw OCR string.
+
+    Only 81 distinct problems exist, so repeats are the norm over a
+    session.
+    """
+    return solve_expression(raw)
+
+
+# Pixel-hash of a math-region capture -> solved answer. Identical pixels
+# always mean the same expression, so a repeat capture skips OCR too.
+_IMG_ANSWER_CACHE = {}
+
+
+def _math_thumb(shot):
+    """8x8 grayscale thumbnail of a math-region capture (change gate)."""
+    return np.asarray(shot.resize((8, 8)).convert("L"), dtype=np.int16)
+
+
+def handle_captcha(positions, debug=False, shot=None, log=print):
+    """Detect, read, solve, and submit the CAPTCHA.
+
+    log is the output callable — print for the CLI, a no-op for the TUI
+    (see handle_captcha_quiet).
+    """
+    x, y, w, h = positions["math_region"]
+    if w <= 0 or h <= 0:
         return False
 
-    time.sleep(0.5)
+    # One capture serves both the dialog check and the first OCR pass
+    if shot is None:
+        shot, w, h = _capture_math_region(positions)
+    else:
+        w, h = shot.size
+    if _dialog_brightness(shot) <= 160:
+        return False
 
-    raw_text = read_math_expression(positions, debug)
     ts = time.strftime("%H:%M:%S")
-    print(f"\n    [{ts}] CAPTCHA detected! Expression: '{raw_text}'", end="")
-
-    answer = solve_expression(raw_text)
-    if answer is None:
-        print(" -> FAILED, retrying...")
-        time.sleep(0.8)
-        raw_text = read_math_expression(positions, debug)
-        print(f"    Retry: '{raw_text}'", end="")
-        answer = solve_expression(raw_text)
+
+    img_key = hashlib.blake2b(shot.tobytes(), digest_size=8).digest()
+    answer = _IMG_ANSWER_CACHE.get(img_key)
+    if answer is not None:
+        log(f"\n    [{ts}] CAPTCHA detected! (answer cached)", end="")
+    else:
+        raw_text = read_math_expression(positions, debug, shot=shot)
+        log(f"\n    [{ts}] CAPTCHA detected! Expression: '{raw_text}'", end="")
+
+        answer = _solve_cached(raw_text)
         if answer is None:
-            print(" -> FAILED again")
-            return False
+            log(" -> FAILED, retrying...")
+            time.sleep(0.8)
+            raw_text = read_math_expression(positions, debug)
+            log(f"    Retry: '{raw_text}'", end="")
+            answer = _solve_cached(raw_text)
+            if answer is None:
+                log(" -> FAILED again")
+                return False
+
+        if len(_IMG_ANSWER_CACHE) > 256:
+            _IMG_ANSWER_CACHE.clear()
+        _IMG_ANSWER_CACHE[img_key] = answer
 
-    print(f" = {answer}")
+    log(f" = {answer}")
 
     numpad = positions["numpad"]
 
@@ -469,6 +708,27 @@ def handle_captcha(positions, debug=False):
 #  Main Loop
 # ═══════════════════════════════════════
 
+# Shared window-detection throttle for both the CLI and TUI loops
+_WIN_POLL = {"win": None, "ts": 0.0}
+
+
+def _maybe_refresh_window(current_win, min_interval=10.0):
+    """Re-detect the game window at most every min_interval seconds.
+
+    Window enumeration is a full CoreGraphics round-trip and the window
+    rarely moves. Returns the freshest known rect (current_win when
+    throttled or when detection fails).
+    """
+    now = time.time()
+    if now - _WIN_POLL["ts"] < min_interval:
+        return _WIN_POLL["win"] or current_win
+    _WIN_POLL["ts"] = now
+    new_win = find_game_window()
+    if new_win:
+        _WIN_POLL["win"] = new_win
+        return new_win
+    return current_win
+
 def run(interval=3.0, debug=False):
     """Main automation loop: click garden + solve CAPTCHAs."""
     layout = load_layout()
@@ -500,21 +760,32 @@ def run(interval=3.0, debug=False):
 
     cycle = 0
     captchas_solved = 0
+    garden_misses = 0
+    prev_thumb = None
 
     try:
         while True:
             cycle += 1
             ts = time.strftime("%H:%M:%S")
 
-            new_win = find_game_window()
-            if new_win:
-                win = new_win
-                positions = get_positions(win, layout)
+            # Re-detect right away when the garden button vanished twice
+            # (the window probably moved); otherwise the helper throttles.
+            if garden_misses >= 2:
+                _WIN_POLL["ts"] = 0.0
+                garden_misses = 0
+            new_win = _maybe_refresh_window(win)
+            # Positions are pure functions of the window origin — only
+            # rebuild the dict when it actually moved
+            if (new_win["x"], new_win["y"]) != (win["x"], win["y"]):
+                positions = get_positions(new_win, layout)
+            win = new_win
 
             if is_garden_visible(positions):
+                garden_misses = 0
                 click_at(*positions["garden"], jitter=8)
                 print(f"[{ts}] #{cycle:>4d} | garden click", end="", flush=True)
             else:
+                garden_misses += 1
                 print(f"[{ts}] #{cycle:>4d} | garden not visible, skipping", end="", flush=True)
 
             jitter_range = interval * 0.3
@@ -522,10 +793,26 @@ def run(interval=3.0, debug=False):
             wait = max(1.0, wait)
             time.sleep(wait)
 
-            if handle_captcha(positions, debug):
+            # Cheap change gate: compare an 8x8 thumb of the math region
+            # against last cycle's; when nothing changed and no dialog was
+            # pending, the whole CAPTCHA pipeline can be skipped.
+            shot, _, _ = _capture_math_region(positions)
+            thumb = _math_thumb(shot)
+            unchanged = (prev_thumb is not None
+                         and int(np.abs(thumb - prev_thumb).sum())
+                         < CAPTCHA_THUMB_DIFF)
+            prev_thumb = thumb
+
+            if not unchanged and handle_captcha(positions, debug, shot=shot):
                 captchas_solved += 1
+                prev_thumb = None  # dialog just closed — recheck next cycle
                 print(f"    Total CAPTCHAs solved: {captchas_solved}")
             else:
+                # A dialog that was visible but not solved must stay
+                # eligible for retries — don't let the gate latch onto
+                # its static pixels
+                if not unchanged and _dialog_brightness(shot) > 160:
+                    prev_thumb = None
                 print()
 
             time.sleep(0.3 + random.random() * 0.7)
@@ -546,10 +833,14 @@ def run(interval=3.0, debug=False):
 class GardenBotThread:
     """Runs garden automation in a background thread with callback-based logging."""
 
-    def __init__(self, interval=3.0, debug=False, log_callback=None):
+    def __init__(self, interval=3.0, debug=False, log_callback=None,
+                 state_callback=None):
         self.interval = interval
         self.debug = debug
         self.log = log_callback or (lambda msg: None)
+        # Fired whenever displayed state changes so the TUI can update
+        # on events instead of polling
+        self._on_state_change = state_callback or (lambda: None)
         self.running = False
         self.captchas_solved = 0
         self.cycle = 0
@@ -562,10 +853,12 @@ class GardenBotThread:
         self.running = True
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
+        self._on_state_change()
         self.log("Garden bot started")
 
     def stop(self):
         self.running = False
+        self._on_state_change()
         self.log("Garden bot stopped")
 
     def _loop(self):
@@ -582,15 +875,17 @@ class GardenBotThread:
             return
 
         positions = get_positions(win, layout)
+        prev_thumb = None
 
         while self.running:
             try:
                 self.cycle += 1
+                self._on_state_change()
 
-                new_win = find_game_window()
-                if new_win:
-                    win = new_win
-                    positions = get_positions(win, layout)
+                new_win = _maybe_refresh_window(win)
+                if (new_win["x"], new_win["y"]) != (win["x"], win["y"]):
+                    positions = get_positions(new_win, layout)
+                win = new_win
 
                 if is_garden_visible(positions):
                     click_at(*positions["garden"], jitter=8)
@@ -599,9 +894,23 @@ class GardenBotThread:
                 wait = self.interval + random.uniform(-jitter_range, jitter_range)
                 time.sleep(max(1.0, wait))
 
-                if handle_captcha_quiet(positions, self.debug):
+                # Same 8x8 change gate as the CLI loop
+                shot, _, _ = _capture_math_region(positions)
+                thumb = _math_thumb(shot)
+                unchanged = (prev_thumb is not None
+                             and int(np.abs(thumb - prev_thumb).sum())
+                             < CAPTCHA_THUMB_DIFF)
+                prev_thumb = thumb
+
+                if not unchanged and handle_captcha_quiet(
+                        positions, self.debug, shot=shot):
                     self.captchas_solved += 1
+                    prev_thumb = None
+                    self._on_state_change()
                     self.log(f"Garden CAPTCHA solved (total: {self.captchas_solved})")
+                elif not unchanged and _dialog_brightness(shot) > 160:
+                    # Visible but unsolved — keep retrying next cycle
+                    prev_thumb = None
 
                 time.sleep(0.3 + random.random() * 0.7)
 
@@ -610,40 +919,9 @@ class GardenBotThread:
                 time.sleep(2)
 
 
-def handle_captcha_quiet(positions, debug=False):
-    """CAPTCHA handler that doesn't print to stdout (for TUI mode)."""
-    if not is_dialog_visible(positions):
-        return False
-
-    time.sleep(0.5)
-
-    raw_text = read_math_expression(positions, debug)
-    answer = solve_expression(raw_text)
-    if answer is None:
-        time.sleep(0.8)
-        raw_text = read_math_expression(positions, debug)
-        answer = solve_expression(raw_text)
-        if answer is None:
-            return False
-
-    numpad = positions["numpad"]
-
-    click_at(*positions["input"], jitter=5)
-    time.sleep(0.4 + random.random() * 0.3)
-
-    click_at(*numpad["clear"], jitter=4)
-    time.sleep(0.2 + random.random() * 0.2)
-
-    type_on_numpad(answer, numpad)
-    time.sleep(0.3 + random.random() * 0.3)
-
-    click_at(*numpad["confirm"], jitter=4)
-    time.sleep(0.4 + random.random() * 0.3)
-
-    click_at(*positions["ok"], jitter=6)
-    time.sleep(0.8 + random.random() * 0.5)
-
-    return True
+# Same handler without stdout chatter (for TUI mode)
+handle_captcha_quiet = functools.partial(handle_captcha,
+                                         log=lambda *args, **kwargs: None)
 
 
 # ═══════════════════════════════════════
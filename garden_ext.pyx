@@ -0,0 +1,31 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Optional compiled pixel kernels for garden_bot.
+
+Build in place with:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+garden_bot falls back to Numba or NumPy versions of these functions
+when the extension isn't built.
+"""
+
+
+def patch_diff(const unsigned char[::1] a, const unsigned char[::1] b):
+    """Sum of absolute differences over two flat uint8 buffers."""
+    cdef Py_ssize_t i, n = a.shape[0]
+    cdef long long s = 0
+    for i in range(n):
+        s += abs(<int>a[i] - <int>b[i])
+    return s
+
+
+def mean_u8(const unsigned char[::1] a):
+    """Mean of a flat uint8 buffer."""
+    cdef Py_ssize_t i, n = a.shape[0]
+    cdef unsigned long long s = 0
+    if n == 0:
+        return 0.0
+    for i in range(n):
+        s += a[i]
+    return s / <double>n
@@ -14,6 +14,8 @@ Controls:
 import time
 import sys
 import os
+import threading
+from collections import deque
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -26,12 +28,12 @@ from textual.widgets import (
     Checkbox,
 )
 from textual.binding import Binding
+from textual.message import Message
 from textual.reactive import reactive
 
 from shared import (
     load_layout,
     load_boss_config,
-    save_boss_config,
     find_game_window,
     calibrate_boss,
     SCRIPT_DIR,
@@ -40,6 +42,18 @@ from boss_bot import BossFarmingBot, MVP_BOSSES, MINI_BOSSES
 from garden_bot import GardenBotThread
 
 
+# ═══════════════════════════════════════
+#  Messages
+# ═══════════════════════════════════════
+
+class BossStateChanged(Message):
+    """A boss-bot thread reported a displayed-state change."""
+
+
+class GardenStateChanged(Message):
+    """The garden-bot thread reported a displayed-state change."""
+
+
 # ═══════════════════════════════════════
 #  Widgets
 # ═══════════════════════════════════════
@@ -68,8 +82,19 @@ class StatusPanel(Static):
     garden_interval = reactive(3.0)
     captchas_solved = reactive(0)
 
+    # render() fires once per reactive write; cache the formatted string
+    # so back-to-back writes with the same values reuse it
+    _last_key = None
+    _last_render = ""
+
     def render(self) -> str:
-        return (
+        key = (self.bot_state, self.target_boss, self.death_count,
+               self.channel, self.garden_status, self.garden_interval,
+               self.captchas_solved)
+        if key == self._last_key:
+            return self._last_render
+        self._last_key = key
+        self._last_render = (
             f"[bold]State:[/]    {self.bot_state}\n"
             f"[bold]Target:[/]   {self.target_boss}\n"
             f"[bold]Deaths:[/]   {self.death_count}\n"
@@ -79,6 +104,7 @@ class StatusPanel(Static):
             f"[bold]Interval:[/] {self.garden_interval}s\n"
             f"[bold]CAPTCHAs:[/] {self.captchas_solved}"
         )
+        return self._last_render
 
 
 class ControlsPanel(Static):
@@ -183,13 +209,27 @@ class RagnarokBotApp(App):
 
     def __init__(self):
         super().__init__()
-        self._boss_bot = BossFarmingBot(log_callback=self._bot_log)
+        self._boss_bot = BossFarmingBot(
+            log_callback=self._bot_log,
+            state_callback=lambda: self._notify_state(BossStateChanged),
+        )
         self._garden_bot = GardenBotThread(
             interval=3.0,
             log_callback=self._bot_log,
+            state_callback=lambda: self._notify_state(GardenStateChanged),
         )
         self._boss_running = False
         self._garden_running = False
+        self._tooltip_version = None  # last display_version tooltips saw
+        self._boss_checkboxes = []  # populated once in on_mount
+        self._save_timer = None  # pending debounced selection save
+        # Bot threads append here; the UI drains in batches so a log
+        # burst doesn't schedule one event-loop hop per line
+        self._log_queue = deque(maxlen=1000)
+        self._log_lock = threading.Lock()
+        # strftime output cached per whole second — log bursts share it
+        self._ts_sec = -1
+        self._ts_str = ""
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -229,6 +269,13 @@ class RagnarokBotApp(App):
     def on_mount(self) -> None:
         self._log("Ragnarok X Bot ready. Press S to start boss farming, G for garden.")
 
+        # One DOM walk up front; later updates iterate these lists
+        self._boss_checkboxes = list(self.query(BossCheckbox))
+        self._mvp_checkboxes = [cb for cb in self._boss_checkboxes
+                                if cb.is_mvp]
+        self._mini_checkboxes = [cb for cb in self._boss_checkboxes
+                                 if not cb.is_mvp]
+
         layout = load_layout()
         if not layout:
             self._log("[yellow]Warning: No calibration found. Run garden calibration first.[/]")
@@ -243,31 +290,34 @@ class RagnarokBotApp(App):
         else:
             self._log("[red]Game window not detected. Make sure the game is running.[/]")
 
-        self.set_interval(1.0, self._update_status)
+        # Status updates are event-driven (the bots push change
+        # notifications); this slow tick is only a safety net.
+        self.set_interval(10.0, self._update_status)
+        self.set_interval(0.1, self._drain_logs)
 
     # ─── Boss checkbox changes ───
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
-        """Save boss selection when checkboxes change."""
+        """Queue a selection save when checkboxes change (debounced)."""
         if not isinstance(event.checkbox, BossCheckbox):
             return
 
-        selected_mvps = []
-        selected_minis = []
+        # Trailing-edge debounce: toggling 10 bosses in a row costs one
+        # widget scan and one config write, not ten
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(0.3, self._flush_selection)
 
-        for cb in self.query(BossCheckbox):
-            if cb.value:
-                if cb.is_mvp:
-                    selected_mvps.append(cb.boss_name)
-                else:
-                    selected_minis.append(cb.boss_name)
+    def _flush_selection(self) -> None:
+        """Collect the checkbox state and persist it once."""
+        self._save_timer = None
 
-        save_boss_config({
-            "selected_mvps": selected_mvps,
-            "selected_minis": selected_minis,
-            "timers": self._boss_bot.boss_timers,
-        })
+        selected_mvps = [cb.boss_name for cb in self._mvp_checkboxes
+                         if cb.value]
+        selected_minis = [cb.boss_name for cb in self._mini_checkboxes
+                          if cb.value]
 
+        # update_selection writes boss_config.json itself
         self._boss_bot.update_selection(selected_mvps, selected_minis)
         self._log(f"Selection: {len(selected_mvps)} MVPs, {len(selected_minis)} Minis")
 
@@ -337,9 +387,18 @@ class RagnarokBotApp(App):
 
     # ─── Logging ───
 
+    def _ts(self) -> str:
+        """Current HH:MM:SS, recomputed at most once per second."""
+        second = int(time.time())
+        if second != self._ts_sec:
+            self._ts_sec = second
+            self._ts_str = time.strftime("%H:%M:%S",
+                                         time.localtime(second))
+        return self._ts_str
+
     def _log(self, message: str) -> None:
         """Add a timestamped message to the activity log."""
-        ts = time.strftime("%H:%M:%S")
+        ts = self._ts()
         try:
             log_widget = self.query_one("#activity-log", RichLog)
             log_widget.write(f"[dim]{ts}[/] {message}")
@@ -347,12 +406,41 @@ class RagnarokBotApp(App):
             pass
 
     def _bot_log(self, message: str) -> None:
-        """Log callback that works from both the main thread and background threads."""
+        """Log callback for bot threads: enqueue and return.
+
+        Lines are drained on the UI side every 100ms, so a burst of bot
+        chatter costs one batched write instead of a call_from_thread
+        round-trip per message.
+        """
+        with self._log_lock:
+            self._log_queue.append((self._ts(), message))
+
+    def _drain_logs(self) -> None:
+        """Flush queued bot log lines into the activity log."""
+        with self._log_lock:
+            if not self._log_queue:
+                return
+            pending = list(self._log_queue)
+            self._log_queue.clear()
         try:
-            self.call_from_thread(self._log, message)
+            log_widget = self.query_one("#activity-log", RichLog)
+        except Exception:
+            return
+        for ts, message in pending:
+            log_widget.write(f"[dim]{ts}[/] {message}")
+
+    def _notify_state(self, message_cls) -> None:
+        """State callback for the bots; safe from any thread."""
+        try:
+            self.call_from_thread(self.post_message, message_cls())
         except RuntimeError:
-            # Already on the main/app thread — call directly
-            self._log(message)
+            self.post_message(message_cls())
+
+    def on_boss_state_changed(self, message: BossStateChanged) -> None:
+        self._update_status()
+
+    def on_garden_state_changed(self, message: GardenStateChanged) -> None:
+        self._update_status()
 
     # ─── Status Updates ───
 
@@ -363,6 +451,11 @@ class RagnarokBotApp(App):
         except Exception:
             return
 
+        # Collapse the seven reactive writes into one screen update
+        with self.batch_update():
+            self._write_status(status)
+
+    def _write_status(self, status) -> None:
         # Boss bot status
         if self._boss_running and self._boss_bot.running:
             status.bot_state = f"[green]{self._boss_bot.status_text}[/]"
@@ -388,10 +481,13 @@ class RagnarokBotApp(App):
         status.garden_interval = self._garden_bot.interval
         status.captchas_solved = self._garden_bot.captchas_solved
 
-        # Update boss timer tooltips
-        for cb in self.query(BossCheckbox):
-            timer_text = self._boss_bot.get_boss_status(cb.boss_name)
-            cb.tooltip = timer_text
+        # Update boss timer tooltips — only when a status could actually
+        # have changed, so steady-state refreshes write nothing
+        version = self._boss_bot.display_version
+        if version != self._tooltip_version:
+            self._tooltip_version = version
+            for cb in self._boss_checkboxes:
+                cb.tooltip = self._boss_bot.get_boss_status(cb.boss_name)
 
 
 # ═══════════════════════════════════════
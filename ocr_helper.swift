@@ -1,34 +1,153 @@
 import Cocoa
 import Vision
 
-guard CommandLine.arguments.count > 1 else {
-    fputs("Usage: ocr_helper <image_path>\n", stderr)
-    exit(1)
+func loadCGImage(data: Data) -> CGImage? {
+    guard let image = NSImage(data: data),
+          let tiffData = image.tiffRepresentation,
+          let bitmap = NSBitmapImageRep(data: tiffData) else {
+        return nil
+    }
+    return bitmap.cgImage
 }
 
-let path = CommandLine.arguments[1]
-guard let image = NSImage(contentsOfFile: path),
-      let tiffData = image.tiffRepresentation,
-      let bitmap = NSBitmapImageRep(data: tiffData),
-      let cgImage = bitmap.cgImage else {
-    fputs("Cannot load image\n", stderr)
-    exit(1)
+func loadCGImage(path: String) -> CGImage? {
+    guard let image = NSImage(contentsOfFile: path),
+          let tiffData = image.tiffRepresentation,
+          let bitmap = NSBitmapImageRep(data: tiffData) else {
+        return nil
+    }
+    return bitmap.cgImage
+}
+
+func recognize(cgImage: CGImage, emitBoxes: Bool, fast: Bool) -> [String]? {
+    let request = VNRecognizeTextRequest()
+    // .fast skips the heavier layout analysis — fine for single-line
+    // UI crops, where .accurate buys nothing.
+    request.recognitionLevel = fast ? .fast : .accurate
+    request.usesLanguageCorrection = false
+    // Pin the language so Vision doesn't spend time on detection;
+    // everything the bots read is Latin-script game UI.
+    request.recognitionLanguages = ["en-US"]
+
+    let handler = VNImageRequestHandler(cgImage: cgImage, options: [:])
+    do {
+        try handler.perform([request])
+    } catch {
+        return nil
+    }
+
+    guard let observations = request.results else { return [] }
+    var lines: [String] = []
+    for observation in observations {
+        guard let candidate = observation.topCandidates(1).first else { continue }
+        if emitBoxes {
+            // Vision boxes are normalized with origin at bottom-left; emit the
+            // line's vertical center as a top-origin fraction of image height.
+            let yFraction = 1.0 - observation.boundingBox.midY
+            lines.append(String(format: "%.4f\t%@", yFraction, candidate.string))
+        } else {
+            lines.append(candidate.string)
+        }
+    }
+    return lines
 }
 
-let request = VNRecognizeTextRequest()
-request.recognitionLevel = .accurate
-request.usesLanguageCorrection = false
+var arguments = Array(CommandLine.arguments.dropFirst())
+
+if arguments.first == "--serve" {
+    // Persistent mode: the Vision stack is loaded once and stays warm.
+    // Requests on stdin are either "OCR <path>" / "BOXES <path>" lines,
+    // or "OCRB <length>" / "BOXESB <length>" followed by that many bytes
+    // of PNG data (append "_FAST" to any command for the fast level).
+    // Each reply is a line count followed by that many result lines.
+    setbuf(stdout, nil)
+    let stdinHandle = FileHandle.standardInput
+    var buffer = Data()
+
+    func readLineData() -> String? {
+        while true {
+            if let idx = buffer.firstIndex(of: 0x0A) {
+                let lineData = buffer.prefix(upTo: idx)
+                buffer.removeSubrange(buffer.startIndex...idx)
+                return String(data: lineData, encoding: .utf8)
+            }
+            let chunk = stdinHandle.availableData
+            if chunk.isEmpty { return nil }
+            buffer.append(chunk)
+        }
+    }
+
+    func readBytes(_ count: Int) -> Data? {
+        while buffer.count < count {
+            let chunk = stdinHandle.availableData
+            if chunk.isEmpty { return nil }
+            buffer.append(chunk)
+        }
+        let data = Data(buffer.prefix(count))
+        buffer.removeFirst(count)
+        return data
+    }
+
+    while let line = readLineData() {
+        let parts = line.split(separator: " ", maxSplits: 1).map(String.init)
+        guard parts.count == 2 else {
+            print(0)
+            continue
+        }
+        let command = parts[0]
+        let emitBoxes = command.hasPrefix("BOXES")
+        let fast = command.hasSuffix("_FAST")
+        let isBytes = command.hasPrefix("OCRB") || command.hasPrefix("BOXESB")
 
-let handler = VNImageRequestHandler(cgImage: cgImage, options: [:])
-do {
-    try handler.perform([request])
-} catch {
-    fputs("Vision error: \(error)\n", stderr)
+        var cgImage: CGImage? = nil
+        if isBytes {
+            if let length = Int(parts[1]), let data = readBytes(length) {
+                cgImage = loadCGImage(data: data)
+            } else {
+                break  // stream desynced — bail out and let the client respawn
+            }
+        } else {
+            cgImage = loadCGImage(path: parts[1])
+        }
+
+        guard let image = cgImage,
+              let lines = recognize(cgImage: image, emitBoxes: emitBoxes, fast: fast) else {
+            print(0)
+            continue
+        }
+        print(lines.count)
+        for result in lines { print(result) }
+    }
+    exit(0)
+}
+
+var emitBoxes = false
+if let flagIndex = arguments.firstIndex(of: "--boxes") {
+    emitBoxes = true
+    arguments.remove(at: flagIndex)
+}
+var fast = false
+if let flagIndex = arguments.firstIndex(of: "--fast") {
+    fast = true
+    arguments.remove(at: flagIndex)
+}
+
+guard let path = arguments.first else {
+    fputs("Usage: ocr_helper [--serve] [--boxes] [--fast] <image_path|->\n", stderr)
     exit(1)
 }
 
-guard let observations = request.results else { exit(0) }
-for observation in observations {
-    guard let candidate = observation.topCandidates(1).first else { continue }
-    print(candidate.string)
+// "-" reads PNG bytes from stdin instead of a file path
+let cgImage: CGImage?
+if path == "-" {
+    cgImage = loadCGImage(data: FileHandle.standardInput.readDataToEndOfFile())
+} else {
+    cgImage = loadCGImage(path: path)
+}
+
+guard let image = cgImage,
+      let lines = recognize(cgImage: image, emitBoxes: emitBoxes, fast: fast) else {
+    fputs("Cannot load image or Vision error\n", stderr)
+    exit(1)
 }
+for result in lines { print(result) }
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Builds the optional garden_ext pixel-kernel extension.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+
+The bots run fine without it — garden_bot falls back to Numba or NumPy
+implementations of the same kernels.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required to build garden_ext: pip install cython")
+
+setup(
+    name="garden_ext",
+    ext_modules=cythonize(
+        [Extension(
+            "garden_ext",
+            ["garden_ext.pyx"],
+            extra_compile_args=["-O3", "-ftree-vectorize"],
+        )],
+        language_level=3,
+    ),
+)
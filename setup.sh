@@ -18,6 +18,11 @@ echo
 echo "Installing Python packages..."
 pip3 install -r requirements.txt
 
+# Optional: Pillow-SIMD is a drop-in Pillow replacement with AVX2-
+# accelerated resize/convert — worth it on Intel Macs (needs a compiler;
+# Apple Silicon gains little, so it's not installed by default):
+#   pip3 uninstall -y pillow && pip3 install pillow-simd
+
 echo
 echo "Done! Quick start:"
 echo
@@ -6,10 +6,28 @@ Provides window detection, clicking, OCR, and config management
 used by both garden_bot.py and boss_bot.py.
 """
 
+import numpy as np
 import pyautogui
+from PIL import Image, ImageOps
 import time
+
+try:
+    # optional: in-process CoreGraphics capture — far faster than
+    # pyautogui's screencapture round-trip
+    import mss
+except ImportError:
+    mss = None
+
+try:
+    import Quartz as _Quartz
+except ImportError:
+    _Quartz = None
+import atexit
+import hashlib
+import io
 import subprocess
-import tempfile
+import threading
+from collections import OrderedDict
 import os
 import random
 import json
@@ -29,31 +47,95 @@ OCR_HELPER = os.path.join(SCRIPT_DIR, "ocr_helper")
 #  Window Detection
 # ═══════════════════════════════════════
 
-def find_game_window():
-    """Auto-detect the Ragnarok X window using CoreGraphics (no permissions needed)."""
+# Short-TTL cache: window enumeration is an IPC round-trip and several
+# loops ask for the rect far more often than it can move
+_WIN_CACHE = {"t": 0.0, "v": None}
+
+
+def invalidate_game_window_cache():
+    """Force the next find_game_window call to re-detect."""
+    _WIN_CACHE["t"] = 0.0
+
+
+def find_game_window(force=False):
+    """Auto-detect the Ragnarok X window (cached for 2 seconds).
+
+    Pass force=True to bypass the cache, e.g. right after a resize.
+    """
+    if (not force and _WIN_CACHE["v"] is not None
+            and time.monotonic() - _WIN_CACHE["t"] < 2.0):
+        return _WIN_CACHE["v"]
+    win = _detect_game_window()
+    if win:
+        _WIN_CACHE["v"] = win
+        _WIN_CACHE["t"] = time.monotonic()
+    return win
+
+
+# Window number of the last match — subsequent detections can ask
+# CoreGraphics for that one window instead of enumerating them all
+_WIN_NUMBER = {"id": None}
+
+
+def _window_rect(info):
+    bounds = info.get("kCGWindowBounds", {})
+    return {
+        "x": int(bounds.get("X", 0)),
+        "y": int(bounds.get("Y", 0)),
+        "w": int(bounds.get("Width", 0)),
+        "h": int(bounds.get("Height", 0)),
+    }
+
+
+def _detect_game_window():
+    """Locate the Ragnarok X window using CoreGraphics (no permissions needed)."""
     try:
         import Quartz
+    except ImportError:
+        # Only when PyObjC itself is unavailable do we pay for osascript
+        return _detect_game_window_applescript()
+
+    # Fast path: look up the previously-matched window by number
+    if _WIN_NUMBER["id"] is not None:
         windows = Quartz.CGWindowListCopyWindowInfo(
-            Quartz.kCGWindowListOptionOnScreenOnly,
-            Quartz.kCGNullWindowID
-        )
-        for w in windows:
+            Quartz.kCGWindowListOptionIncludingWindow, _WIN_NUMBER["id"])
+        for w in windows or []:
             owner = w.get("kCGWindowOwnerName", "")
-            if "Ragnarok" in owner or "ragnarok" in owner.lower():
-                bounds = w.get("kCGWindowBounds", {})
-                layer = w.get("kCGWindowLayer", 0)
-                if layer != 0:
-                    continue
-                return {
-                    "x": int(bounds.get("X", 0)),
-                    "y": int(bounds.get("Y", 0)),
-                    "w": int(bounds.get("Width", 0)),
-                    "h": int(bounds.get("Height", 0)),
-                }
-    except ImportError:
-        pass
+            if "ragnarok" in owner.lower() and w.get("kCGWindowLayer", 0) == 0:
+                return _window_rect(w)
+        _WIN_NUMBER["id"] = None  # stale — fall through to a full scan
+
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly,
+        Quartz.kCGNullWindowID
+    )
+    for w in windows or []:
+        owner = w.get("kCGWindowOwnerName", "")
+        # One lowercase allocation per candidate window; the
+        # case-insensitive check subsumes the exact match
+        if "ragnarok" in owner.lower():
+            if w.get("kCGWindowLayer", 0) != 0:
+                continue
+            _WIN_NUMBER["id"] = w.get("kCGWindowNumber")
+            return _window_rect(w)
+
+    # Second pass: some clients expose the game name only in the window
+    # title rather than the owning process name
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionAll, Quartz.kCGNullWindowID)
+    for w in windows or []:
+        name = w.get("kCGWindowName") or ""
+        if "ragnarok" in name.lower() and w.get("kCGWindowLayer", 0) == 0:
+            _WIN_NUMBER["id"] = w.get("kCGWindowNumber")
+            return _window_rect(w)
+
+    # Quartz worked and found nothing — the window isn't there, so don't
+    # fork osascript just to confirm it
+    return None
+
 
-    # Fallback: AppleScript
+def _detect_game_window_applescript():
+    """AppleScript fallback used only when PyObjC is missing."""
     for name_pattern in ["Ragnarok X", "Ragnarok"]:
         script = f'''
         tell application "System Events"
@@ -100,108 +182,508 @@ def get_window_or_exit():
 #  Config Management
 # ═══════════════════════════════════════
 
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+
+def _load_json(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+# Parsed-config cache keyed on file mtime; repeat loads are a dict hit.
+# Callers treat the returned object as shared and read-only.
+_CFG_CACHE = {}
+
+
+def _load_json_cached(path):
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    cached = _CFG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = _load_json(path)
+    _CFG_CACHE[path] = (mtime, data)
+    return data
+
+
+def _save_json(path, data):
+    """Serialize and atomically replace path — no torn file on crash."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    _CFG_CACHE.pop(path, None)
+
+
 def load_layout():
     """Load calibrated pixel offsets from config.json."""
-    if not os.path.exists(CONFIG_FILE):
-        return None
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
+    return _load_json_cached(CONFIG_FILE)
 
 
 def save_layout(layout):
     """Save calibrated pixel offsets to config.json."""
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(layout, f, indent=2)
+    _save_json(CONFIG_FILE, layout)
 
 
 def load_boss_config():
     """Load boss selection and timer data from boss_config.json."""
-    if not os.path.exists(BOSS_CONFIG_FILE):
+    config = _load_json_cached(BOSS_CONFIG_FILE)
+    if config is None:
         return {"selected_mvps": [], "selected_minis": [], "timers": {}}
-    with open(BOSS_CONFIG_FILE) as f:
-        return json.load(f)
+    return config
 
 
 def save_boss_config(config):
     """Save boss selection and timer data."""
-    with open(BOSS_CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    _save_json(BOSS_CONFIG_FILE, config)
 
 
 # ═══════════════════════════════════════
 #  Mouse Actions
 # ═══════════════════════════════════════
 
-def click_at(x, y, jitter=6):
-    """Click with explicit press-hold-release for reliable registration."""
-    dx = random.randint(-jitter, jitter)
-    dy = random.randint(-jitter, jitter)
-    target_x = int(x + dx)
-    target_y = int(y + dy)
+# Click jitter comes from one batched C-level draw per click instead of
+# six separate Mersenne Twister calls. numpy Generators are not
+# thread-safe and both bots can click from their own threads, so each
+# thread gets its own generator.
+_rng_local = threading.local()
+
+
+def _click_jitter():
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = np.random.default_rng()
+        _rng_local.rng = rng
+    return rng.random(6)
+
+
+def _native_failsafe_check():
+    """Mirror pyautogui's corner failsafe on the native event path.
+
+    The Quartz click branch never goes through pyautogui, so the
+    advertised "slam the mouse into a corner to abort" kill-switch has
+    to be checked here too.
+    """
+    loc = _Quartz.CGEventGetLocation(_Quartz.CGEventCreate(None))
+    bounds = _Quartz.CGDisplayBounds(_Quartz.CGMainDisplayID())
+    max_x = bounds.size.width - 1
+    max_y = bounds.size.height - 1
+    if (loc.x <= 0 or loc.x >= max_x) and (loc.y <= 0 or loc.y >= max_y):
+        raise pyautogui.FailSafeException(
+            "Mouse moved to a screen corner — aborting (failsafe)")
 
-    move_duration = 0.1 + random.random() * 0.25
+
+def _post_mouse_event(event_type, x, y):
+    event = _Quartz.CGEventCreateMouseEvent(
+        None, event_type, (x, y), _Quartz.kCGMouseButtonLeft)
+    _Quartz.CGEventPost(_Quartz.kCGHIDEventTap, event)
+
+
+def click_at(x: float, y: float, jitter: int = 6) -> None:
+    """Click with explicit press-hold-release for reliable registration."""
+    r = _click_jitter()
+    target_x = int(x + (r[0] * 2.0 - 1.0) * jitter)
+    target_y = int(y + (r[1] * 2.0 - 1.0) * jitter)
+
+    if _Quartz is not None:
+        # Post events straight to the HID tap — skips pyautogui's
+        # Python-animated move and its built-in per-call pause, while
+        # keeping the human-ish press/hold/release timing. The corner
+        # failsafe is checked first, like pyautogui would.
+        _native_failsafe_check()
+        _post_mouse_event(_Quartz.kCGEventMouseMoved, target_x, target_y)
+        time.sleep(0.05 + r[3] * 0.08)
+        _post_mouse_event(_Quartz.kCGEventLeftMouseDown, target_x, target_y)
+        time.sleep(0.04 + r[4] * 0.06)
+        _post_mouse_event(_Quartz.kCGEventLeftMouseUp, target_x, target_y)
+        time.sleep(0.03 + r[5] * 0.05)
+        return
+
+    move_duration = 0.1 + r[2] * 0.25
     pyautogui.moveTo(target_x, target_y, duration=move_duration)
 
-    time.sleep(0.05 + random.random() * 0.08)
+    time.sleep(0.05 + r[3] * 0.08)
     pyautogui.mouseDown()
-    time.sleep(0.04 + random.random() * 0.06)
+    time.sleep(0.04 + r[4] * 0.06)
     pyautogui.mouseUp()
-    time.sleep(0.03 + random.random() * 0.05)
+    time.sleep(0.03 + r[5] * 0.05)
 
 
-def type_on_numpad(number, numpad):
+def type_on_numpad(number, numpad) -> None:
     """Click numpad digits to enter a number."""
-    for ch in str(abs(int(number))):
-        if ch in numpad:
-            click_at(*numpad[ch], jitter=4)
-            time.sleep(0.2 + random.random() * 0.25)
+    # Resolve the click sequence up front; the loop is then just clicks
+    coords = [numpad[ch] for ch in str(abs(int(number))) if ch in numpad]
+    for x, y in coords:
+        click_at(x, y, jitter=4)
+        time.sleep(random.uniform(0.2, 0.45))
 
 
 # ═══════════════════════════════════════
 #  OCR via macOS Vision
 # ═══════════════════════════════════════
 
-def ocr_vision(image_path):
-    """Run macOS Vision OCR via the compiled Swift helper.
+# Long-lived OCR helper process (--serve mode). Spawning the helper per
+# call pays process startup + Vision warmup every time; keeping one warm
+# process amortizes that to zero. Guarded by a lock since both bots OCR
+# from their own threads.
+_OCR_PROC = None
+_OCR_LOCK = threading.Lock()
+
+
+def _spawn_ocr_proc():
+    return subprocess.Popen(
+        [OCR_HELPER, "--serve"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _ensure_ocr_proc():
+    """(Re)spawn the persistent helper if needed. Caller holds _OCR_LOCK."""
+    global _OCR_PROC
+    if _OCR_PROC is None or _OCR_PROC.poll() is not None:
+        _OCR_PROC = _spawn_ocr_proc()
+    return _OCR_PROC
+
 
-    Returns the recognized text, or empty string on failure.
+def _kill_ocr_proc():
+    """Tear down a wedged helper. Caller holds _OCR_LOCK."""
+    global _OCR_PROC
+    if _OCR_PROC is not None:
+        try:
+            _OCR_PROC.kill()
+        except Exception:
+            pass
+        _OCR_PROC = None
+
+
+def _shutdown_ocr_proc():
+    """Don't leave the helper daemon running after the bots exit."""
+    with _OCR_LOCK:
+        _kill_ocr_proc()
+
+
+atexit.register(_shutdown_ocr_proc)
+
+
+# How long a single helper reply may take before the process is
+# presumed wedged (mirrors the old one-shot subprocess timeout)
+_OCR_REPLY_TIMEOUT = 5.0
+
+
+def _read_ocr_reply(proc):
+    """Read one count-prefixed reply from the helper.
+
+    A watchdog kills the helper if the reply doesn't complete in time,
+    so a hung Vision call can't block OCR (and the lock) forever; the
+    dead pipe then raises into the caller's kill-and-respawn path.
     """
+    watchdog = threading.Timer(_OCR_REPLY_TIMEOUT, proc.kill)
+    watchdog.start()
     try:
+        count = int(proc.stdout.readline().strip())
+        return [proc.stdout.readline().decode("utf-8", "replace").rstrip("\n")
+                for _ in range(count)]
+    finally:
+        watchdog.cancel()
+
+
+def _ocr_helper_request_data(command, png_bytes):
+    """Send one in-memory PNG request to the persistent OCR helper."""
+    with _OCR_LOCK:
+        try:
+            proc = _ensure_ocr_proc()
+            proc.stdin.write(f"{command} {len(png_bytes)}\n".encode()
+                             + png_bytes)
+            proc.stdin.flush()
+            return _read_ocr_reply(proc)
+        except Exception:
+            _kill_ocr_proc()
+            return None
+
+
+def ocr_vision_data(png_bytes, fast=False):
+    """OCR an in-memory PNG without touching the filesystem."""
+    lines = _ocr_helper_request_data("OCRB_FAST" if fast else "OCRB",
+                                     png_bytes)
+    if lines is not None:
+        return "\n".join(lines).strip()
+
+    # Fallback: one-shot helper reading the PNG from stdin
+    try:
+        cmd = [OCR_HELPER, "-"]
+        if fast:
+            cmd.insert(1, "--fast")
         result = subprocess.run(
-            [OCR_HELPER, image_path],
-            capture_output=True, text=True, timeout=5
+            cmd, input=png_bytes, capture_output=True, timeout=5
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.decode("utf-8", "replace").strip()
     except Exception:
         pass
     return ""
 
 
-def ocr_region(x, y, w, h):
+def ocr_vision_batch_data(png_blobs):
+    """OCR several in-memory PNGs in one round-trip to the helper."""
+    with _OCR_LOCK:
+        try:
+            proc = _ensure_ocr_proc()
+            payload = b"".join(
+                f"OCRB {len(blob)}\n".encode() + blob for blob in png_blobs)
+            proc.stdin.write(payload)
+            proc.stdin.flush()
+            return ["\n".join(_read_ocr_reply(proc)).strip()
+                    for _ in png_blobs]
+        except Exception:
+            _kill_ocr_proc()
+
+    return [ocr_vision_data(blob) for blob in png_blobs]
+
+
+def warm_ocr_helper():
+    """Spawn the persistent OCR helper ahead of time.
+
+    The helper is started lazily on first use; calling this at bot start
+    moves the process spawn + Vision warmup out of the first in-game OCR.
+    """
+    with _OCR_LOCK:
+        try:
+            _ensure_ocr_proc()
+        except Exception:
+            _kill_ocr_proc()
+
+
+def ocr_vision_lines_data(png_bytes):
+    """Positioned-line OCR on an in-memory PNG.
+
+    Returns a list of (y_fraction, text) tuples, where y_fraction is the
+    line's vertical center as a fraction of image height (0.0 = top).
+    """
+    raw_lines = _ocr_helper_request_data("BOXESB", png_bytes)
+    if raw_lines is None:
+        try:
+            result = subprocess.run(
+                [OCR_HELPER, "--boxes", "-"],
+                input=png_bytes, capture_output=True, timeout=5
+            )
+            if result.returncode != 0:
+                return []
+            raw_lines = result.stdout.decode("utf-8", "replace").splitlines()
+        except Exception:
+            return []
+    return _parse_box_lines(raw_lines)
+
+
+def _parse_box_lines(raw_lines):
+    """Parse "y_fraction<TAB>text" helper output into tuples."""
+    lines = []
+    for raw in raw_lines:
+        frac, sep, text = raw.partition("\t")
+        if not sep:
+            continue
+        try:
+            lines.append((float(frac), text))
+        except ValueError:
+            continue
+    return lines
+
+
+def _prep_for_ocr(img):
+    """Grayscale + contrast-stretch a UI crop before OCR.
+
+    Game text is crisp on a dark background, so the stretch makes it
+    pop for Vision and the grayscale payload is smaller to process.
+    """
+    return ImageOps.autocontrast(img.convert("L"))
+
+
+def _image_png_bytes(img):
+    """Encode a PIL image as PNG bytes (fast, low-compression)."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def ocr_image_lines(img, enhance=False):
+    """Run positioned-line OCR on an already-captured PIL image.
+
+    Returns (y_fraction, text) tuples like ocr_vision_lines_data.
+    """
+    if enhance:
+        img = _prep_for_ocr(img)
+    return ocr_vision_lines_data(_image_png_bytes(img))
+
+
+def ocr_region_lines(x, y, w, h, enhance=False):
+    """Screenshot a screen region and OCR it, returning positioned lines.
+
+    Like ocr_region, but each line comes back with its vertical center as
+    a fraction of the region height so callers can map text to UI rows.
+    Pass enhance=True to contrast-stretch the crop first.
+    """
+    shot = screenshot_region(x, y, w, h)
+    return ocr_image_lines(shot, enhance=enhance)
+
+
+def ocr_image(img, fast=False):
+    """Run OCR on an already-captured PIL image.
+
+    Returns the recognized text. The PNG is piped to the helper in
+    memory — no tempfile round-trip.
+    """
+    return ocr_vision_data(_image_png_bytes(img), fast=fast)
+
+
+# Content-keyed OCR memo (opt-in per call site): identical pixels always
+# produce identical text, so repeat reads skip the helper entirely
+_OCR_TEXT_CACHE = OrderedDict()
+_OCR_TEXT_CACHE_SIZE = 128
+
+
+# Last (pixel hash, text) per named region — for rectangles one caller
+# polls repeatedly, an unchanged frame costs only the hash
+_REGION_HASHES = {}
+
+
+def ocr_region(x, y, w, h, cache=False, region_id=None):
     """Screenshot a screen region and run OCR on it.
 
-    Returns the recognized text.
+    Returns the recognized text. cache=True memoizes on the raw pixel
+    content — right for regions that sit unchanged between reads (status
+    labels, buttons), wrong for fast-changing ones. region_id names a
+    repeatedly-polled rectangle so unchanged frames skip OCR entirely;
+    flat featureless crops short-circuit to "" without calling the
+    helper at all.
     """
-    shot = pyautogui.screenshot(region=(int(x), int(y), int(w), int(h)))
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        shot.save(f.name)
-        text = ocr_vision(f.name)
-        os.unlink(f.name)
+    shot = screenshot_region(x, y, w, h)
+
+    if region_id is not None:
+        key = hashlib.blake2b(shot.tobytes(), digest_size=8).digest()
+        last = _REGION_HASHES.get(region_id)
+        if last is not None and last[0] == key:
+            return last[1]
+        if float(np.asarray(shot.convert("L"), dtype=np.uint8).std()) < 2.0:
+            text = ""  # uniform crop — nothing to recognize
+        else:
+            text = ocr_image(shot)
+        _REGION_HASHES[region_id] = (key, text)
+        return text
+
+    if not cache:
+        return ocr_image(shot)
+
+    key = hashlib.blake2b(shot.tobytes(), digest_size=8).digest()
+    if key in _OCR_TEXT_CACHE:
+        _OCR_TEXT_CACHE.move_to_end(key)
+        return _OCR_TEXT_CACHE[key]
+    text = ocr_image(shot)
+    _OCR_TEXT_CACHE[key] = text
+    if len(_OCR_TEXT_CACHE) > _OCR_TEXT_CACHE_SIZE:
+        _OCR_TEXT_CACHE.popitem(last=False)
     return text
 
 
+# One mss session reused for every grab (created lazily, recreated if a
+# grab ever fails). All capture in both bots funnels through here.
+_SCT = None
+_SCT_LOCK = threading.Lock()
+
+
+def _grab_region_quartz(x, y, w, h):
+    """Capture a region via CGWindowListCreateImage.
+
+    Returns a PIL Image, or None when the capture fails (caller falls
+    back to the next backend).
+    """
+    rect = _Quartz.CGRectMake(x, y, w, h)
+    image = _Quartz.CGWindowListCreateImage(
+        rect,
+        _Quartz.kCGWindowListOptionOnScreenOnly,
+        _Quartz.kCGNullWindowID,
+        _Quartz.kCGWindowImageDefault,
+    )
+    if image is None:
+        return None
+    width = _Quartz.CGImageGetWidth(image)
+    height = _Quartz.CGImageGetHeight(image)
+    if width == 0 or height == 0:
+        return None
+    stride = _Quartz.CGImageGetBytesPerRow(image)
+    data = _Quartz.CGDataProviderCopyData(
+        _Quartz.CGImageGetDataProvider(image))
+    return Image.frombuffer("RGBA", (width, height), bytes(data),
+                            "raw", "BGRA", stride, 1).convert("RGB")
+
+
 def screenshot_region(x, y, w, h):
-    """Take a screenshot of a screen region. Returns PIL Image."""
+    """Take a screenshot of a screen region. Returns PIL Image.
+
+    Backends in order of preference: direct CoreGraphics (captures only
+    the requested rect, no subprocess), then mss, then pyautogui.
+    """
+    if _Quartz is not None:
+        try:
+            shot = _grab_region_quartz(int(x), int(y), int(w), int(h))
+            if shot is not None:
+                return shot
+        except Exception:
+            pass
+
+    global _SCT
+    if mss is not None:
+        with _SCT_LOCK:
+            try:
+                if _SCT is None:
+                    _SCT = mss.mss()
+                grab = _SCT.grab({"left": int(x), "top": int(y),
+                                  "width": int(w), "height": int(h)})
+                return Image.frombytes("RGB", grab.size, grab.rgb)
+            except Exception:
+                _SCT = None
     return pyautogui.screenshot(region=(int(x), int(y), int(w), int(h)))
 
 
-def check_brightness(x, y, w, h, threshold=160):
+def region_brightness_sparse(x: float, y: float, w: int, h: int) -> float:
+    """Mean brightness of 9 probe points spread across a region.
+
+    One screenshot is still taken (that cost is unavoidable), but only
+    9 pixels are read from it — plenty for a uniformly-filled area like
+    the minimap, and it skips converting/averaging the whole crop.
+    """
+    shot = screenshot_region(x, y, w, h)
+    px = shot.load()
+    # Probe offsets come from the actual capture size — the buffer is
+    # at backing scale (2x on Retina), not the requested w/h
+    pw, ph = shot.size
+    total = 0.0
+    for fx in (0.2, 0.5, 0.8):
+        for fy in (0.2, 0.5, 0.8):
+            r, g, b = px[int(pw * fx), int(ph * fy)][:3]
+            total += 0.299 * r + 0.587 * g + 0.114 * b
+    return total / 9.0
+
+
+def check_brightness(x: float, y: float, w: int, h: int,
+                     threshold: int = 160) -> bool:
     """Check if a screen region is brighter than threshold (dialog detection)."""
-    shot = pyautogui.screenshot(region=(int(x), int(y), int(w), int(h)))
-    gray = shot.convert("L")
-    avg = sum(gray.getdata()) / len(list(gray.getdata()))
-    return avg > threshold
+    shot = screenshot_region(x, y, w, h)
+    arr = np.asarray(shot.convert("L"), dtype=np.uint8)
+    # Comparing the integer sum against threshold*size gives the same
+    # answer as a mean without the floating-point divide
+    return int(arr.sum(dtype=np.uint64)) > threshold * arr.size
 
 
 # ═══════════════════════════════════════
@@ -224,6 +706,13 @@ BOSS_CALIBRATION_STEPS = [
 ]
 
 
+# Step prompts formatted once at import rather than per calibration run
+_BOSS_STEP_PROMPTS = [
+    f"  [{i:>2d}/{len(BOSS_CALIBRATION_STEPS)}] Hover over: {desc} -> Enter: "
+    for i, (_, desc) in enumerate(BOSS_CALIBRATION_STEPS, 1)
+]
+
+
 def calibrate_boss():
     """Record 11 boss-related positions.
 
@@ -247,7 +736,7 @@ def calibrate_boss():
     total = len(BOSS_CALIBRATION_STEPS)
 
     for i, (key, description) in enumerate(BOSS_CALIBRATION_STEPS, 1):
-        input(f"  [{i:>2d}/{total}] Hover over: {description} -> Enter: ")
+        input(_BOSS_STEP_PROMPTS[i - 1])
         p = pyautogui.position()
         offset = (p.x - win["x"], p.y - win["y"])
         boss_layout[key] = list(offset)
@@ -290,11 +779,24 @@ def calibrate_boss():
     print()
 
 
+# Position dicts keyed by (layout identity, window origin) — the math is
+# deterministic, so repeat calls for an unmoved window are a dict hit
+_BOSS_POS_CACHE = {}
+
+
 def get_boss_positions(win, layout):
     """Calculate absolute screen positions for boss-related elements."""
     if "boss" not in layout:
         return None
 
+    # The entry keeps a reference to the layout it was built from: an
+    # id() alone could collide with a recycled address after the old
+    # layout dict is freed, silently serving stale positions.
+    cache_key = (id(layout), win["x"], win["y"])
+    cached = _BOSS_POS_CACHE.get(cache_key)
+    if cached is not None and cached[0] is layout:
+        return cached[1]
+
     boss = layout["boss"]
     wx, wy = win["x"], win["y"]
 
@@ -310,4 +812,7 @@ def get_boss_positions(win, layout):
         else:
             positions[key] = (wx + offset[0], wy + offset[1])
 
+    if len(_BOSS_POS_CACHE) > 8:
+        _BOSS_POS_CACHE.clear()
+    _BOSS_POS_CACHE[cache_key] = (layout, positions)
     return positions